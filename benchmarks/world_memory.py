@@ -0,0 +1,105 @@
+# Measures how much memory one game world takes, with the slotted classes
+# of the game and with the same content in plain __dict__ classes, the
+# layout used before they were slotted.
+# Run from the project root with `python benchmarks/world_memory.py`.
+import os
+import pickle
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from game.bundle import STORYLINES, compile_storyline  # noqa: E402
+from game.world import load_template, new_world  # noqa: E402
+
+
+class DictAreaState:
+    """
+    Overlay of a template area keeping its attributes in a __dict__, as
+    AreaState did before it was slotted.
+    """
+
+    def __init__(self, template) -> None:
+        self.template = template
+        self._items = None
+        self._enemy = None
+
+
+def slots_of(cls) -> list:
+    """
+    Returns the slots a class and its bases declare.
+    """
+    return [name for base in cls.__mro__
+            for name in base.__dict__.get("__slots__", ())]
+
+
+def unslotted(value, classes: dict):
+    """
+    Returns a copy of the content with every slotted object rebuilt as an
+    instance of a plain class of the same name, its attributes in a
+    __dict__. Strings and numbers are shared with the content.
+    - classes: the plain classes made so far, by slotted class
+    """
+    if isinstance(value, list):
+        return [unslotted(item, classes) for item in value]
+    if isinstance(value, tuple):
+        return tuple(unslotted(item, classes) for item in value)
+    if isinstance(value, dict):
+        return {key: unslotted(item, classes) for key, item in value.items()}
+    names = slots_of(type(value))
+    if not names:
+        return value
+    cls = type(value)
+    if cls not in classes:
+        classes[cls] = type(cls.__name__, (), {})
+    plain = object.__new__(classes[cls])
+    for name in names:
+        if hasattr(value, name):
+            setattr(plain, name, unslotted(getattr(value, name), classes))
+    return plain
+
+
+def measure(build) -> int:
+    """
+    Returns the bytes still allocated by what build returns.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def dict_world(level: int) -> dict:
+    """
+    Returns the overlays of a new game like new_world, in __dict__ classes.
+    """
+    return {
+        key: [DictAreaState(area) for area in value]
+        if key.endswith("_areas") else value
+        for key, value in load_template(level).items()
+    }
+
+
+def main() -> None:
+    print(f"{'storyline':<12}{'full world (dict -> slots)':>32}"
+          f"{'game overlay (dict -> slots)':>32}")
+    for level, name in STORYLINES.items():
+        data = compile_storyline(level)
+        load_template(level)
+        # Make the plain classes first, so only the content is counted
+        classes = {}
+        unslotted(pickle.loads(data), classes)
+        full_dict = measure(lambda: unslotted(pickle.loads(data), classes))
+        full = measure(lambda: pickle.loads(data))
+        overlay_dict = measure(lambda: dict_world(level))
+        overlay = measure(lambda: new_world(level))
+        print(f"{name:<12}{full_dict:>14,} B -> {full:>10,} B"
+              f"{overlay_dict:>14,} B -> {overlay:>10,} B")
+
+
+if __name__ == "__main__":
+    main()
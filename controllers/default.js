@@ -1,13 +1,73 @@
 const Pty = require('node-pty');
 const fs = require('fs');
+const net = require('net');
+const EventEmitter = require('events');
+const { spawn } = require('child_process');
+
+// When set, sessions are forked from a pre-warmed Python zygote listening on
+// this UNIX socket instead of starting a new interpreter per connection.
+const ZYGOTE_SOCKET = process.env.ZYGOTE_SOCKET;
+const ZYGOTE_POOL = process.env.ZYGOTE_POOL || '4';
+
+// Token of a game saved when its player went idle, sent back by the page.
+const SESSION_TOKEN = /^[0-9a-f]{12}$/;
 
 exports.install = function () {
 
     ROUTE('/');
     WEBSOCKET('/', socket, ['raw']);
 
+    if (ZYGOTE_SOCKET) {
+        startZygote();
+    }
+
 };
 
+function startZygote() {
+
+    const zygote = spawn('python3', ['zygote.py', ZYGOTE_SOCKET, ZYGOTE_POOL], {
+        cwd: process.env.PWD,
+        env: process.env,
+        stdio: ['ignore', 'inherit', 'inherit']
+    });
+
+    zygote.on('exit', function (code, signal) {
+        console.log("Zygote exited, restarting", code, signal);
+        setTimeout(startZygote, 1000);
+    });
+}
+
+// Connects to the zygote and exposes the same interface as a node-pty
+// terminal, so the socket handlers below work with either.
+function connectZygote() {
+
+    const tty = new EventEmitter();
+    const connection = net.connect(ZYGOTE_SOCKET);
+    connection.setEncoding('utf8');
+
+    connection.on('data', function (data) {
+        tty.emit('data', data);
+    });
+
+    connection.on('close', function () {
+        tty.emit('exit', 0, null);
+    });
+
+    connection.on('error', function (err) {
+        console.log('Zygote connection error: ', err.message);
+    });
+
+    tty.write = function (data) {
+        connection.write(data);
+    };
+
+    tty.kill = function () {
+        connection.destroy();
+    };
+
+    return tty;
+}
+
 function socket() {
 
     this.encodedecode = false;
@@ -16,7 +76,7 @@ function socket() {
     this.on('open', function (client) {
 
         // Spawn terminal
-        client.tty = Pty.spawn('python3', ['run.py'], {
+        client.tty = ZYGOTE_SOCKET ? connectZygote() : Pty.spawn('python3', ['run.py'], {
             name: 'xterm-color',
             cols: 80,
             rows: 24,
@@ -34,6 +94,14 @@ function socket() {
             client.send(data);
         });
 
+        // Resume the saved game by answering the username prompt ahead:
+        // the intro still plays, then the game reads the waiting answer
+        // at the username prompt and carries on where the player left
+        var token = client.query && client.query.resume;
+        if (token && SESSION_TOKEN.test(token)) {
+            client.tty.write('resume ' + token + '\r');
+        }
+
     });
 
     this.on('close', function (client) {
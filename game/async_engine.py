@@ -0,0 +1,238 @@
+import asyncio
+
+from utils import text, add_space, clear_terminal, paragraph, ask_user_async
+from .items import Weapon, Armour, Potion, Book, Item
+from .interactions import Interaction, Combat
+from .locations import Location, Area, Yolkaris, Mystara, Luminara
+from .game_manager import GameOver
+from .odds import fight_odds
+
+
+class AsyncInteraction(Interaction):
+    """
+    Interaction that awaits the player's answers instead of blocking.
+    """
+
+    async def print_story_line(self, story_line):
+        """
+        Prints the story line to the session.
+        """
+        for line in story_line:
+            space = line['space'] if 'space' in line else 1
+            delay = line['delay'] if 'delay' in line else 0.2
+            color = line['color'] if 'color' in line else None
+            if 'clear' in line:
+                clear_terminal(port=self.port)
+            elif 'text' in line:
+                paragraph(line['text'], space=space, color=color, delay=delay,
+                          port=self.port)
+            elif 'continue' in line:
+                await ask_user_async('continue', space=space, port=self.port)
+            elif 'item' in line:
+                self.add_new_item(line['item'])
+            elif 'gameover' in line:
+                raise GameOver()
+
+    async def with_area(self, area, visited):
+        """
+        Handles the interaction with an area.
+        """
+        add_space(port=self.port)
+        if not visited:
+            await self.print_story_line(area.story_line)
+        else:
+            await self.print_story_line(area.story_line_visited)
+
+    async def with_neutral(self, neutral, visited):
+        """
+        Handles the interaction with a neutral character.
+        """
+        if not visited:
+            await self.print_story_line(neutral.story_line)
+        elif neutral.quest_item and any(
+                item.name == neutral.quest_item.name for item in
+                self.player.inventory):
+            await self.print_story_line(neutral.story_line_completed)
+        else:
+            await self.print_story_line(neutral.story_line_visited)
+
+    async def with_enemy(self, enemy, location, visited):
+        """
+        Handles the interaction with an enemy.
+        """
+        if not visited:
+            await self.print_story_line(enemy.story_line)
+        elif enemy.health <= 0:
+            await self.print_story_line(enemy.story_line_defeated)
+            return
+        elif enemy.fought:
+            await self.print_story_line(enemy.story_line_fought)
+        else:
+            await self.print_story_line(enemy.story_line_visited)
+        text(f"{enemy.name} stats - health: {enemy.health}, "
+             f"attack: {enemy.attack}, "
+             f"defense: {enemy.defense}", space=1, port=self.port)
+
+        # A fight whose odds were not computed before the session started
+        # would hold up every session of the loop
+        odds = await asyncio.get_running_loop().run_in_executor(
+            None, fight_odds, self.player, enemy)
+        self.show_odds(enemy, odds)
+        combat = AsyncCombat(self.player, enemy, port=self.port,
+                             rng=self.rng)
+        results = await combat.to_fight_or_not_to_fight()
+        if results == "retreat":
+            text("You have retreated from the battle.", port=self.port)
+            location.return_to_previous_position()
+            return False
+        elif results == "won":
+            text(f"You have defeated {enemy.name}!", space=1, port=self.port)
+            await self.print_story_line(enemy.story_line_won_fight)
+            return True
+        elif results == "lost":
+            text(f"You have been defeated by {enemy.name}!", space=1,
+                 port=self.port)
+            await self.print_story_line(enemy.story_line_lost_fight)
+
+
+class AsyncCombat(Combat):
+    """
+    Combat that awaits the player's decisions instead of blocking.
+    """
+
+    async def combat(self):
+        """
+        Handles the combat between the player and the enemy.
+        """
+        self.enemy.fought = True
+
+        while self.player.health > 0 and self.enemy.health > 0:
+            self.player_attack()
+            if self.enemy.health <= 0:
+                return "won"
+
+            self.enemy_attack()
+            if self.player.health <= 0:
+                return "lost"
+
+            if await self.continue_or_flee():
+                break
+
+        return "retreat"
+
+    async def to_fight_or_not_to_fight(self):
+        """
+        Handles the decision to fight or retreat.
+        """
+        if await ask_user_async('combat', port=self.port):
+            return await self.combat()
+        return "retreat"
+
+    async def continue_or_flee(self):
+        """
+        Prompts the player to continue or flee the battle.
+        """
+        return await ask_user_async('retreat', port=self.port)
+
+
+class AsyncLocation(Location):
+    """
+    Location whose interactions await the player's answers.
+    """
+
+    async def check_for_interaction(self, position, player):
+        """
+        Checks for interaction with the area at the specified position.
+        """
+        visited = self.is_visited(position)
+        element = self.contents.get(position)
+        if not isinstance(element, Area):
+            return
+        interaction = AsyncInteraction(player, port=self.port, rng=self.rng)
+        await interaction.with_area(element, visited)
+        self.mark_visited(self.player_position)
+
+        if element.enemy:
+            await interaction.with_enemy(element.enemy, self, visited)
+
+        if (not element.enemy or element.enemy.health <= 0) \
+                and element.neutral:
+            await interaction.with_neutral(element.neutral, visited)
+
+    async def search_area(self, player):
+        """
+        Searches the area for items.
+        """
+        area = self.contents.get(self.player_position)
+        if not (hasattr(area, "items") and area.items):
+            text("You searched the area but found nothing.", port=self.port)
+            return
+
+        text("You found the following items:", space=1, port=self.port)
+        for index, item in enumerate(area.items):
+            text(f"{index + 1}. {item.name}", port=self.port)
+
+        add_space(port=self.port)
+        prompt = ("Select an item number to interact with, or type "
+                  "'0' to cancel:")
+        choices = [str(i) for i in range(1, len(area.items) + 1)]
+        choice = await ask_user_async("number", numbers=choices,
+                                      prompt=prompt, port=self.port)
+        if choice == 0:
+            text("You decided not to pick up any items.", port=self.port)
+        else:
+            await self.interact_with_area_items(
+                area.items[choice - 1], area, player)
+
+    async def interact_with_area_items(self, item, area, player):
+        """
+        Interacts with the items in the area.
+        """
+        add_space(port=self.port)
+        text(f"You found a {item.name}.", port=self.port)
+        if isinstance(item, (Weapon, Armour)):
+            if not await ask_user_async("confirm",
+                                        prompt="Do you want to equip it?",
+                                        port=self.port):
+                return
+            slot = 'weapon' if isinstance(item, Weapon) else 'armour'
+            if getattr(player, slot):
+                area.items.append(getattr(player, slot))
+            setattr(player, slot, item)
+            text(f"You have equipped the {item.name}.", space=1,
+                 port=self.port)
+            area.items.remove(item)
+        elif isinstance(item, Item):
+            if not await ask_user_async("confirm",
+                                        prompt="Do you want to take it?",
+                                        port=self.port):
+                return
+            area.items.remove(item)
+            if isinstance(item, Potion):
+                player.potions.append(item)
+                text(f"You have added the {item.name} to your inventory.",
+                     space=1, port=self.port)
+            elif isinstance(item, Book):
+                player.inventory.append(item)
+                text("You have added the book to your inventory.", space=1,
+                     port=self.port)
+            else:
+                player.inventory.append(item)
+
+
+class AsyncYolkaris(AsyncLocation, Yolkaris):
+    """
+    Yolkaris for games hosted on an event loop.
+    """
+
+
+class AsyncMystara(AsyncLocation, Mystara):
+    """
+    Mystara for games hosted on an event loop.
+    """
+
+
+class AsyncLuminara(AsyncLocation, Luminara):
+    """
+    Luminara for games hosted on an event loop.
+    """
@@ -0,0 +1,145 @@
+from functools import lru_cache
+import importlib
+import os
+import pickle
+import sys
+
+# Module and variable holding the content of each game level.
+STORYLINES = {
+    1: "game_one",
+    2: "game_two"
+}
+
+# Modules of the classes stored in the bundles. Bundles older than any of
+# them are rebuilt, as pickles depend on the layout of those classes.
+CLASS_MODULES = ["characters.py", "items.py", "locations.py"]
+
+BUNDLE_DIR = os.path.join(os.path.dirname(__file__), "bundles")
+
+# Words of the title banner shown by the game intro, and their font.
+BANNER_WORDS = ("Yolkaris", "Odyssey")
+BANNER_FONT = "dos_rebel"
+
+
+def bundle_path(level: int) -> str:
+    """
+    Returns the path of the compiled bundle for the game level.
+    """
+    return os.path.join(BUNDLE_DIR, f"{STORYLINES[level]}.pickle")
+
+
+def source_path(level: int) -> str:
+    """
+    Returns the path of the module defining the game level.
+    """
+    return os.path.join(os.path.dirname(__file__),
+                        f"{STORYLINES[level]}.py")
+
+
+def compile_storyline(level: int) -> bytes:
+    """
+    Builds the content of the game level from its Python definitions and
+    returns it pickled.
+    """
+    name = STORYLINES[level]
+    module = importlib.import_module(f"game.{name}")
+    return pickle.dumps(getattr(module, name), protocol=5)
+
+
+def build(level: int) -> bytes:
+    """
+    Compiles the bundle of the game level and writes it next to the game.
+    Returns the bundle so it can be used even if it could not be saved.
+    """
+    data = compile_storyline(level)
+    try:
+        os.makedirs(BUNDLE_DIR, exist_ok=True)
+        temp_path = bundle_path(level) + ".tmp"
+        with open(temp_path, "wb") as bundle:
+            bundle.write(data)
+        os.replace(temp_path, bundle_path(level))
+    except OSError:
+        pass
+    return data
+
+
+def is_fresh(level: int) -> bool:
+    """
+    Checks that the bundle exists and is newer than its definitions and the
+    classes it stores.
+    """
+    sources = [source_path(level)] + [
+        os.path.join(os.path.dirname(__file__), module)
+        for module in CLASS_MODULES
+    ]
+    try:
+        built = os.path.getmtime(bundle_path(level))
+        return all(built >= os.path.getmtime(source) for source in sources)
+    except OSError:
+        return False
+
+
+def load_storyline(level: int) -> dict:
+    """
+    Returns a fresh copy of the content of the game level, loaded from its
+    bundle. The bundle is compiled first if it is missing or out of date.
+    Only the selected level is ever loaded.
+    """
+    if is_fresh(level):
+        with open(bundle_path(level), "rb") as bundle:
+            return pickle.load(bundle)
+    return pickle.loads(build(level))
+
+
+def banner_path() -> str:
+    """
+    Returns the path of the pre-rendered title banner.
+    """
+    return os.path.join(BUNDLE_DIR, "banner.pickle")
+
+
+def build_banner() -> tuple:
+    """
+    Renders the title banner and writes it next to the game. Returns the
+    banner so it can be used even if it could not be saved.
+    """
+    # art loads every font it knows, so it is only imported to build
+    from art import text2art
+
+    banner = tuple(
+        text2art(word, font=BANNER_FONT, chr_ignore=True)
+        for word in BANNER_WORDS
+    )
+    try:
+        os.makedirs(BUNDLE_DIR, exist_ok=True)
+        temp_path = banner_path() + ".tmp"
+        with open(temp_path, "wb") as asset:
+            pickle.dump(banner, asset, protocol=5)
+        os.replace(temp_path, banner_path())
+    except OSError:
+        pass
+    return banner
+
+
+@lru_cache(maxsize=None)
+def load_banner() -> tuple:
+    """
+    Returns the rendered lines of the title banner, one entry per word. The
+    banner is read from its asset once per process, and only rendered when
+    the asset is missing.
+    """
+    try:
+        with open(banner_path(), "rb") as asset:
+            return pickle.load(asset)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return build_banner()
+
+
+if __name__ == "__main__":
+    levels = [int(level) for level in sys.argv[1:]] or list(STORYLINES)
+    for game_level in levels:
+        build(game_level)
+        print(f"Built {bundle_path(game_level)}")
+    if not sys.argv[1:]:
+        build_banner()
+        print(f"Built {banner_path()}")
@@ -1,9 +1,16 @@
+# Stats every player starts the game with.
+PLAYER_HEALTH = 100
+PLAYER_ATTACK = 15
+PLAYER_DEFENSE = 10
+
 
 class Character:
     """
     Initializes a character.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name = name
 
@@ -13,6 +20,9 @@ class Player(Character):
     Initializes a player character.
     """
 
+    __slots__ = ("health", "attack", "defense", "inventory", "potions",
+                 "weapon", "armour")
+
     def __init__(
             self,
             name: str,
@@ -36,6 +46,11 @@ class Enemy(Character):
     Initializes an enemy character.
     """
 
+    __slots__ = ("story_line", "story_line_visited", "story_line_fought",
+                 "story_line_won_fight", "story_line_lost_fight",
+                 "story_line_defeated", "health", "attack", "defense",
+                 "fought")
+
     def __init__(
             self,
             name: str,
@@ -68,6 +83,9 @@ class Neutral(Character):
     Initializes a neutral character.
     """
 
+    __slots__ = ("story_line", "story_line_visited", "story_line_completed",
+                 "quest_item")
+
     def __init__(
             self,
             name,
@@ -0,0 +1,77 @@
+from utils import SEPARATOR
+from .game_manager import game_manager
+
+# Marks a prefix shared by several commands.
+AMBIGUOUS = object()
+
+
+class CommandRegistry:
+    """
+    Maps what the player types at the main prompt to the command to run.
+    A command is found by its name, one of its aliases or any prefix of its
+    name no other command shares, in a single dictionary lookup.
+    """
+
+    def __init__(self) -> None:
+        self.handlers = {}
+        self.names = {}
+        self.prefixes = {}
+
+    def register(self, name: str, handler, aliases=(),
+                 abbreviate: bool = True) -> None:
+        """
+        Registers a command, replacing any command of the same name.
+        - name: the name of the command
+        - handler: called with the game to run the command, may return an
+          awaitable in asynchronous games
+        - aliases: other names the command can be entered with
+        - abbreviate: whether the command can be entered by a prefix of
+          its name
+        """
+        self.handlers[name] = handler
+        for word in (name,) + tuple(aliases):
+            self.names[word] = name
+        if abbreviate:
+            for end in range(1, len(name)):
+                prefix = name[:end]
+                known = self.prefixes.get(prefix)
+                self.prefixes[prefix] = name if known in (None, name) \
+                    else AMBIGUOUS
+
+    def resolve(self, word: str):
+        """
+        Returns the name of the command entered, or None if there is no
+        such command or the abbreviation is ambiguous.
+        """
+        word = word.strip().lower()
+        name = self.names.get(word) or self.prefixes.get(word)
+        return None if name is AMBIGUOUS else name
+
+    def parse(self, line: str) -> list:
+        """
+        Returns the handlers of the commands entered on a line, in order,
+        None standing for a command that doesn't exist.
+        """
+        words = [word for word in line.split(SEPARATOR) if word.strip()]
+        if not words:
+            return [None]
+        return [self.handlers.get(self.resolve(word)) for word in words]
+
+
+# Commands available at the main prompt of every game.
+commands = CommandRegistry()
+commands.register("map", lambda game: game.display_map())
+commands.register("north", lambda game: game.update_player_position(0, -1))
+commands.register("south", lambda game: game.update_player_position(0, 1))
+commands.register("east", lambda game: game.update_player_position(1, 0))
+commands.register("west", lambda game: game.update_player_position(-1, 0))
+commands.register("stats", lambda game: game.show_player_stats())
+commands.register("search", lambda game: game.search_current_area(),
+                  aliases=["s"])
+commands.register("inventory", lambda game: game.show_inventory(),
+                  aliases=["i"])
+commands.register("potion", lambda game: game.select_potion(),
+                  aliases=["potions", "p"])
+# Restarting throws the game away, so it has to be typed out in full.
+commands.register("restart", lambda game: game_manager.reset_game(),
+                  abbreviate=False)
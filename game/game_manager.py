@@ -1,23 +1,237 @@
+import random
+
+from utils import PlayerIdle, get_port
+
+
+class GameRestart(Exception):
+    """
+    Raised to abandon the current game and start a new one.
+    """
+
+
+class GameOver(GameRestart):
+    """
+    Raised when the story of the current game reached its end.
+    """
+
+
+class SessionRecovery(GameRestart):
+    """
+    Raised to rebuild a session that ended without saving from its journal,
+    replaying it from the start.
+    - journal: the journal of the session
+    """
+
+    def __init__(self, journal) -> None:
+        super().__init__()
+        self.journal = journal
+
+
 class GameManager:
-    def __init__(self):
+    """
+    Runs the games of a session one after another. Restarts unwind the
+    finished game and start the next one from the same loop, so a session
+    keeps a constant stack depth and only ever holds one game.
+    """
+
+    # Session states
+    STOPPED = "stopped"
+    SETUP = "setup"
+    PLAYING = "playing"
+    RESTARTING = "restarting"
+
+    def __init__(self, replay: bool = True, game_class=None):
         self.game = None
+        self.game_class = game_class
+        self.port = None
+        self.seed = None
+        self.seeds = None
+        self.game_seed = None
+        self.replay = replay
+        self.state = self.STOPPED
+        self.hooks = {"start": [], "finish": [], "save": [], "restart": [],
+                      "end": []}
 
-    def start_game(self):
+    def add_hook(self, event: str, callback) -> None:
         """
-        Initializes and starts the game.
+        Registers a callback run with the game on 'start' (once it is set
+        up), 'finish' (when its story reached its end), 'save' (once it was
+        saved for its idle player), 'restart' (before it is torn down) or
+        'end' (when the session stops).
+        """
+        self.hooks[event].append(callback)
+
+    def run_hooks(self, event: str) -> None:
+        """
+        Runs the callbacks registered for the event.
+        """
+        for callback in self.hooks[event]:
+            callback(self.game)
+
+    def start_game(self, port=None, seed=None, journal: bool = False):
+        """
+        Initializes and starts the game, and keeps starting new ones until
+        the session stops.
+        - port: the port to play through, kept for restarts (defaults to the
+          terminal)
+        - seed: the seed of the session. The first game is played with it
+          and the games after a restart with seeds drawn from it, so the
+          same seed and answers replay the whole session (defaults to a
+          random one)
+        - journal: whether to journal the session, so it can be rebuilt if
+          its process dies
+        The session stops when the player goes idle, after saving the game
+        they can resume later.
+        """
+        self.begin_session(port, seed, journal)
+        try:
+            while self.state != self.STOPPED:
+                game = self.next_game()
+                try:
+                    game.setup_game()
+                    self.game_started()
+                    game.start_game()
+                    self.state = self.STOPPED
+                except GameRestart as restart:
+                    self.game_ended(restart)
+            self.end_journal(remove=True)
+        except PlayerIdle:
+            self.hibernate_game()
+            self.end_journal(remove=True)
+        finally:
+            self.end_session()
+
+    async def start_game_async(self, port=None, seed=None,
+                               journal: bool = False):
+        """
+        Runs the session like start_game, for games whose setup_game and
+        start_game are coroutines, so many sessions share one event loop.
+        """
+        self.begin_session(port, seed, journal)
+        try:
+            while self.state != self.STOPPED:
+                game = self.next_game()
+                try:
+                    await game.setup_game()
+                    self.game_started()
+                    await game.start_game()
+                    self.state = self.STOPPED
+                except GameRestart as restart:
+                    self.game_ended(restart)
+            self.end_journal(remove=True)
+        except PlayerIdle:
+            self.hibernate_game()
+            self.end_journal(remove=True)
+        finally:
+            self.end_session()
+
+    def begin_session(self, port, seed, journal: bool) -> None:
+        """
+        Draws the seed of the session and starts its journal.
+        """
+        from .journal import Journal
+
+        if port is not None:
+            self.port = port
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.seeds = random.Random(self.seed)
+        self.game_seed = self.seed
+        self.state = self.SETUP
+        if journal:
+            Journal.create(self.seed).attach(get_port(self.port))
+
+    def next_game(self):
+        """
+        Builds the next game of the session, with its seed.
         """
         # Import Game class here to avoid circular import issues
         from run import Game
 
-        self.game = Game()
-        self.game.setup_game()
-        self.game.start_game()
+        self.game = (self.game_class or Game)(self.port, self.game_seed)
+        return self.game
+
+    def game_started(self) -> None:
+        """
+        Marks the game set up and about to be played.
+        """
+        self.state = self.PLAYING
+        self.run_hooks("start")
+
+    def game_ended(self, restart: GameRestart) -> None:
+        """
+        Moves the session on from a game that was abandoned, reached the
+        end of its story or has to be rebuilt from a journal.
+        """
+        from .journal import recover
+
+        if isinstance(restart, SessionRecovery):
+            # Start over from the journal's seed, the replayed answers
+            # bring the session back where it was
+            self.seed = recover(get_port(self.port), restart.journal)
+            self.seeds = random.Random(self.seed)
+            self.game = None
+            self.game_seed = self.seed
+            return
+        if isinstance(restart, GameOver):
+            self.run_hooks("finish")
+        self.state = self.RESTARTING
+        self.run_hooks("restart")
+        if isinstance(restart, GameOver) and not self.replay:
+            self.state = self.STOPPED
+            return
+        self.state = self.SETUP
+        # Drop the finished game before building the next one
+        self.game = None
+        self.game_seed = self.seeds.getrandbits(32)
+
+    def end_session(self) -> None:
+        """
+        Stops the session, whichever way it ended.
+        """
+        self.state = self.STOPPED
+        # A journal left behind lets the player rebuild the session
+        self.end_journal()
+        self.run_hooks("end")
+
+    def hibernate_game(self) -> None:
+        """
+        Saves the game of a player who went idle, so the session can end
+        and free its process, and tells them how to resume it. The game is
+        saved as it was at the last main prompt, so an interaction the
+        player left partway plays again in full. Games that never reached
+        the main prompt or are already over are not worth saving.
+        """
+        from .hibernate import hibernate, announce
+
+        game = self.game
+        if game is None or game.checkpoint is None or game.game_over:
+            return
+        journal = get_port(self.port).journal
+        token = hibernate(game, journal.token if journal else None,
+                          game.checkpoint)
+        self.run_hooks("save")
+        announce(token, game.port)
+
+    def end_journal(self, remove: bool = False) -> None:
+        """
+        Closes the journal of the session, if it has one.
+        - remove: delete it, once the session ended for good or was saved
+        """
+        journal = get_port(self.port).journal
+        if journal is not None:
+            journal.close(remove)
 
     def reset_game(self):
         """
-        Resets the game state and starts over.
+        Abandons the current game so the session starts over.
+        """
+        raise GameRestart()
+
+    def game_over(self):
+        """
+        Ends the current game once its story is over.
         """
-        self.start_game()
+        raise GameOver()
 
 
 # Create a singleton GameManager instance
@@ -0,0 +1,1058 @@
+from .characters import Enemy, Neutral
+from .items import Book, Potion, Weapon, Armour, Special
+from .locations import Area
+
+game_one = {
+    "yolkaris_size": (4, 2),
+    "yolkaris_areas": [
+        Area(name="Capital City",
+             story_line=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "The Broken Clock Adventure",
+                     "delay": 1.6,
+                     "space": 1
+                 },
+                 {
+                     "text": "Capital City, where ancient whispers meet the "
+                             "present's breath, lies beneath the Grand "
+                             "Clock's timeless gaze. Its cobbled paths, "
+                             "etched by countless souls, converge at "
+                             "Yolkaris' beating heart."
+                 },
+                 {
+                     "text": "Here stands the Grand Clock, silent sentinel of "
+                             "time, now frozen in an eerie stillness. Amidst "
+                             "this hush, Charlie, a beacon of hope, steps "
+                             "forward with valor and inquisitiveness in his "
+                             "heart."
+                 },
+                 {
+                     "text": "Summoned by the echoes of old tales and the a "
+                             "allure of the unknown, he weaves through the "
+                             "city's veiled streets to the Timekeeper. At the "
+                             "foot of the slumbering clock, vestige of arcane "
+                             "power, a quest of fate unfolds for Charlie."
+                 },
+                 {
+                     "continue": True
+                 },
+                 {
+                     "text": "Embarking on a quest through time's woven "
+                             "fabric, he seeks to stir ancient echoes, "
+                             "awakening the chronicles lost to the ages.",
+                     "space": 1
+                 }
+             ],
+             story_line_visited=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "Back in Capital City, the stillness of the "
+                             "Grand Clock looms, casting a silent shadow over "
+                             "the timeless streets.",
+                     "space": 1
+                 }
+             ],
+             neutral=Neutral(
+                 name="Timekeeper",
+                 quest_item=Special(name="The Time Crystal"),
+                 story_line=[
+                     {
+                         "text": "'Ah, Charlie! The Grand Clock, our has "
+                                 "timeless guardian, ceased its rhythmic "
+                                 "heartbeat. Its magic wanes. The Time "
+                                 "Crystal in Crystal Hills is the key to its "
+                                 "revival.'"
+                     },
+                     {
+                         "text": "'Fear not, Timekeeper. I shall reclaim the "
+                                 "crystal and rekindle the clock's ancient "
+                                 "magic.'"
+                     },
+                     {
+                         "text": "'Be swift, for the sands of time wait for "
+                                 "no one. Our fate rests in your wings.'",
+                         "space": 1
+                     },
+                     {
+                         "continue": True
+                     },
+                     {
+                         "clear": True
+                     },
+                     {
+                         "text": "Embark on the Yolkaris Odyssey with these "
+                                 "words of guidance:"
+                     },
+                     {
+                         "text": "- Use the 'map' command to find your path "
+                                 "within this enchanted land.",
+                         "space": 0,
+                         "delay": 0.0
+                     },
+                     {
+                         "text": "- Traverse the land through 'north', "
+                                 "'south', 'east', and 'west'. Discover your "
+                                 "destiny.",
+                         "space": 0,
+                         "delay": 0.0
+                     },
+                     {
+                         "text": "- In your quest, 'search' the areas for "
+                                 "hidden treasures and secrets.",
+                         "space": 0,
+                         "delay": 0.0
+                     },
+                     {
+                         "text": "- Keep your inventory filled with artifacts "
+                                 "and tools. Check it with the 'inventory' "
+                                 "command.",
+                         "space": 0,
+                         "delay": 0.0
+                     },
+                     {
+                         "text": "- When your health is low, 'potion' can be "
+                                 "used to restore your vitality.",
+                         "space": 0,
+                         "delay": 0.0
+                     },
+                     {
+                         "text": "- Keep an eye on your 'stats' to track your "
+                                 "progress.",
+                         "space": 0,
+                         "delay": 0.0
+                     },
+                     {
+                         "text": "- If you require guidance, simply type "
+                                 "'help' to view a list of available "
+                                 "commands.",
+                         "space": 0,
+                         "delay": 0.0
+                     },
+                     {
+                         "text": "- To begin anew or end your adventure, use "
+                                 "'reset' or 'quit' anytime.",
+                     },
+                     {
+                         "text": "Good fortune on your quest. May your "
+                                 "journey be filled with wonder."
+                     },
+                 ],
+                 story_line_visited=[
+                     {
+                         "text": "Hey Charlie, do you have the crystal?",
+                     },
+                     {
+                         "text": "No I do not.",
+                     },
+                     {
+                         "text": "Without the crystal I can't fix the. clock. "
+                                 "You need to find the crystal.",
+                     },
+                 ],
+                 story_line_completed=[
+                     {
+                         "text": "Ah, Charlie, you've returned! And with the "
+                                 "Time Crystal, no less?",
+                     },
+                     {
+                         "text": "Yes, Timekeeper. The journey was perilous, "
+                                 "but the crystal is here.",
+                     },
+                     {
+                         "text": "Splendid! Let's not waste another moment. "
+                                 "Hand it over, and let's witness history "
+                                 "reborn.",
+                     },
+                     {
+                         "continue": True
+                     },
+                     {
+                         "text": "With a careful hand, the Timekeeper the "
+                                 "places Timekeeper places the crystal into "
+                                 "the heart of the Grand Clock. Ancient gears "
+                                 "begin to turn, a soft ticking fills the "
+                                 "air, growing louder, until the whole town "
+                                 "is enveloped in the familiar sound of "
+                                 "time's steady march. ",
+                     },
+                     {
+                         "text": "The townsfolk gather, eyes wide with a "
+                                 "wonder as the Grand Clock's hands resume "
+                                 "their eternal dance. Cheers erupt, and "
+                                 "Charlie, standing beside the Timekeeper, "
+                                 "watches as the shadow of stagnation lifts, "
+                                 "giving way to renewed flow of time. ",
+                     },
+                     {
+                         "text": "'You've done it, Charlie! The heart of "
+                                 "Yolkaris beats once more, thanks to you. "
+                                 "This day will be remembered as the moment "
+                                 "when time itself was mended by the courage "
+                                 "of a single soul.'",
+                     },
+                     {
+                         "continue": True
+                     },
+                     {
+                         "text": "'Thank you for joining the adventure in "
+                                 "'The Broken Clock.' I hope you found joy "
+                                 "and excitement in unraveling the mysteries "
+                                 "of time and safeguarding the fabric of our "
+                                 "universe. Creating this journey has "
+                                 "been a profound experience for me, filled "
+                                 "with creativity and discovery. I'm grateful "
+                                 "for your willingness to embark on this "
+                                 "quest and for your invaluable support. "
+                                 "Congratulations on overcoming the trials of "
+                                 "time and restoring balance. Until our paths "
+                                 "cross again in future adventures, take care "
+                                 "and all the best, Patrick Hladun.'"
+                     },
+                     {
+                         "text": "Game Over!",
+                     },
+                     {
+                         "continue": True
+                     },
+                     {
+                         "gameover": True
+                     }
+                 ]
+             ),
+             items=[
+                 Book(
+                     name="The Broken Clock Book",
+                     description="A tome chronicling the saga of Yolkaris' "
+                                 "Grand Clock, whose ticking has ceased.",
+                     story_line=[
+                         {
+                             "text": "The Broken Clock: A Tale of "
+                                     "Time's Standstill",
+                             "delay": 0.6,
+                             "space": 1
+                         },
+                         {
+                             "text": "In the heart of Yolkaris stands the "
+                                     "Grand Clock, once the pulsing "
+                                     "chronometer of the realm. Legends say "
+                                     "its hands moved in harmony with the "
+                                     "cosmic dance, until silence befell. The "
+                                     "clock's halt has shrouded Yolkaris in a "
+                                     "temporal anomaly, threatening the very "
+                                     "fabric of time itself. ",
+                             "space": 1
+                         },
+                         {
+                             "text": "The Time Crystal, hidden within the "
+                                     "enigmatic Crystal Hills, holds the "
+                                     "secret to awakening the clock. This "
+                                     "book, penned by the last Timekeeper, "
+                                     "serves as a guide for the brave soul "
+                                     "daring enough to embark on this "
+                                     "perilous quest. To restore the clock's "
+                                     "magic and revive the rhythm of "
+                                     "Yolkaris, the Time Crystal must be "
+                                     "retrieved before the threads of time "
+                                     "unravel completely.",
+                             "space": 1
+                         },
+                     ]
+                 )
+             ],
+             position=(0, 0),
+             ),
+        Area(name="Bounty Harbour",
+             story_line=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "Bounty Harbour, a bustling nexus of commerce "
+                             "and adventure, greets Charlie with the salty "
+                             "kiss of the sea and the rich scents of distant "
+                             "worlds. Here, the dock teems with life, a "
+                             "mosaic of sailors, merchants, and tales waiting "
+                             "to be told."
+                 },
+                 {
+                     "text": "Charlie weaves through the crowds, each step on "
+                             "the cobbled streets a journey through stories "
+                             "untold. The harbour's air is thick with the "
+                             "promise of the unknown, laden with the whispers "
+                             "of faraway places and the echoes of voyages "
+                             "past."
+                 },
+                 {
+                     "text": "'So many paths that converge at a single "
+                             "point,' Charlie muses, his gaze lingering on "
+                             "the horizon where the sea meets the sky. 'Each "
+                             "vessel holds stories as vast as the ocean "
+                             "itself, each sailor a keeper of secrets.'"
+
+                 },
+                 {
+                     "continue": True
+                 },
+                 {
+                     "text": "Pausing to admire a ship setting sail, Charlie "
+                             "feels a surge of wanderlust. 'To embark on a "
+                             "journey without knowing where it might lead,' "
+                             "he reflects, 'that's the true spirit of "
+                             "adventure. Perhaps, one day, I'll find myself "
+                             "aboard, chasing the horizon and the tales it "
+                             "hides.'"
+                 },
+                 {
+                     "text": "As the sun dips lower, casting a golden glow "
+                             "over the harbour, Charlie takes a deep breath, "
+                             "filling his lungs with the briny air of "
+                             "possibility. 'For now,' he decides, 'my "
+                             "adventure lies ahead, on lands uncharted and "
+                             "mysteries unseen. But the call of the sea will "
+                             "always echo in my heart.'"
+                 }
+             ],
+             story_line_visited=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "You are back in Bounty Harbour",
+                 }
+             ],
+             items=[],
+             position=(1, 0),
+             ),
+        Area(name="Cluckington Valley",
+             story_line=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "Cluckington Valley unfolds beneath Charlie's "
+                     "gaze, a vibrant quilt of green fields and wildflowers, "
+                     "embraced by ancient peaks. The colors are so intense, "
+                     "it's as if the valley pulses with life, each beat a "
+                     "whisper of the earth's oldest stories. Wildflowers nod "
+                     "in the gentle breeze, conducting silent symphonies for "
+                     "bees and butterflies, the air sweet with the scent of "
+                     "nectar and fresh grass."
+                 },
+                 {
+                     "text": "Charlie stumbles upon the valley's most curious "
+                     "resident, the 'Laughing Tree' a gnarled oak standing "
+                     "alone, its branches swaying in the wind. The creaks and "
+                     "groans of wood sound remarkably like chuckles and "
+                     "guffaws, as if the tree itself shares a joke known only "
+                     "to the valley. 'Sounds like a gathering of old "
+                     "friends,' Charlie muses, a smile playing on his beak."
+                 },
+                 {
+                   "continue": True
+                 },
+                 {
+                     "text": "'They say it laughs to remind us not to take "
+                     "life too seriously,' an old hen nearby explains, her "
+                     "eyes twinkling with mischief. 'Or maybe it's just happy "
+                     "to see you, Charlie.' The idea that a tree could find "
+                     "amusement in his journey fills Charlie with a "
+                     "light-hearted courage. 'Well, I hope it finds my "
+                     "adventure entertaining,' he replies, laughter bubbling "
+                     "in his chest."
+                 },
+                 {
+                     "text": "As Charlie leaves the Laughing Tree behind, "
+                     "the sound of its mirth lingers in his ears, a "
+                     "comforting reminder that joy can be found in the most "
+                     "unexpected places. 'Keep laughing, old friend,' he "
+                     "calls back. 'I'll bring back stories to make you "
+                     "chuckle even harder.' And with that, he sets off once "
+                     "more, the laughter of the tree echoing like a blessing "
+                     "on the wind."
+                 }
+             ],
+             story_line_visited=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "You are back in Cluckington Valley",
+                 }
+             ],
+             items=[
+                 Book(
+                     name="The Laughing Tree's Joke Book",
+                     description="A collection of the most whimsical "
+                                 "and hearty chuckles sourced directly "
+                                 "from the Laughing Tree of Cluckington "
+                                 "Valley. This book promises to lift the "
+                                 "spirits of anyone brave enough to open "
+                                 "its pages, offering a light-hearted "
+                                 "escape into the world of feathered "
+                                 "humor. ",
+                     story_line=[
+                         {
+                             "text": "Giggles from the Canopy: The Laughing "
+                                     "Tree's Joke Book",
+                         },
+                         {
+                             "text": "1. Why did the chicken join a band? "
+                                     "Because it had the drumsticks ready! ",
+                         },
+                         {
+                             "text": "2. What do you call a chicken that "
+                                     "haunts the barn? A poultry-geist!"
+                         },
+                         {
+                             "text": "3. Why did the rooster go to the "
+                                     "comedy show? To cockle-doodle-DOO its "
+                                     "best impression!"
+                         },
+                         {
+                             "text": "4. What does a chicken need to lay an "
+                                     "egg every day? Hen-durance!"
+                         },
+                         {
+                             "text": "5. How do chickens stay fit? Egg-ercise!"
+                         },
+                         {
+                             "text": "6. What do you call a crazy chicken? "
+                                     "A cuckoo cluck!"
+                         },
+                         {
+                             "text": "7. Why did the chicken stop in the "
+                                     " middle of the road? It saw the sign: "
+                                     "'Egg Xing'!",
+                             "space": 1
+                         }
+                     ]
+                 ),
+                 Potion(
+                     name="Small Potion",
+                     health=25
+                 ),
+             ],
+             position=(0, 1),
+             ),
+        Area(name="Crystal Hills",
+             story_line=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "After his long and arduous journey, the at "
+                             "Charlie, brave chicken from Yolkaris, finally "
+                             "stood the threshold of Crystal Hills. The path "
+                             "he had traversed had been fraught with "
+                             "challenges and perils, but he had endured, "
+                             "driven by the unwavering purpose of obtaining "
+                             "the Time Crystal."
+                 },
+                 {
+                     "text": "After his long and arduous journey, the at "
+                             "Charlie, brave chicken from Yolkaris, finally "
+                             "stood the threshold of Crystal Hills. The path "
+                             "he had traversed had been fraught with "
+                             "challenges and perils, but he had endured, "
+                             "driven by the unwavering purpose of obtaining "
+                             "the Time Crystal."
+                 },
+                 {
+                     "text": "The air was thick with an aura of ancient to "
+                             "magic, and the very ground beneath his feet "
+                             "seemed vibrate with the essence of time itself. "
+                             "Charlie could feel the watchful eyes of the "
+                             "guardian, Phineas Blackthorn, as he neared the "
+                             "heart of the Crystal Hills. "
+                 },
+                 {
+                     "continue": True
+                 },
+                 {
+                     "text": "As Charlie continued his journey through of "
+                             "the surreal and disorienting landscape "
+                             "crystals, he couldn't help but reflect on the "
+                             "trials that had brought him here. The Time "
+                             "Crystal, the key to saving Yolkaris from "
+                             "impending darkness, was within his grasp, but "
+                             "first, he had to face the formidable guardian "
+                             "and prove himself. "
+                 },
+                 {
+                     "text": "Phineas emerged from the shimmering as if a "
+                             "crystals he were part of the very fabric of "
+                             "time itself. His presence commanded the "
+                             "attention of the crystals that surrounded him, "
+                             "their luminous glow accentuating his enigmatic "
+                             "presence. "
+                 },
+                 {
+                     "text": "As Charlie stood before Phineas Blackthorn, "
+                             "the guardian of the Time Crystals, a tense "
+                             "atmosphere hung in the air. The guardian, an "
+                             "enigmatic figure with a monocle and an "
+                             "impeccably groomed feather coat, gazed at "
+                             "Charlie with a wry smile. "
+                 },
+             ],
+             story_line_visited=[
+                 {
+                     "clear": True},
+                 {
+                     "text": "You are back in Crystal Hills",
+                 }],
+             enemy=Enemy(
+                 name="Phineas Blackthorn",
+                 story_line=[
+                     {
+                         "continue": True
+                     },
+                     {
+                         "text": "Ah, young traveler, You've reached the "
+                                 "heart of the Crystal Hills, but before you "
+                                 "can claim the Time Crystal, there's a "
+                                 "challenge you must face."
+                     },
+                     {
+                         "text": "Charlie furrowed his brow, awaiting"
+                                 "Phineas's instructions."
+                     },
+                     {
+                         "text": "We shall have a test of your skills and "
+                                 "intelligence. If you succeed, the Time "
+                                 "Crystal will be yours. Fail, let's just say "
+                                 "you'll be the butt of some egg-cellent "
+                                 "jokes! Oh, ho ho! Ha ha ha! Hee hee! Ah, ha "
+                                 "ha! Hohoho! Ha ha ha! Heeheehe! Ahahaha! Ho "
+                                 "ho ho! Ha ha ha! Hee hee! Ah, ha ha! "
+                                 "Hilarious! Ho ho ho! Ha ha ha! Hee hee! Ah, "
+                                 "ha ha! Tremendous! Oh, ho ho! Ha Marvelous! "
+                                 "Ho ho ho! Ha ha! Uncontrollable! Oh, ho ho! "
+                                 "Ha ha! Hee hee! Oh, I am sorry, "
+                     },
+                     {
+                         "continue": True
+                     },
+                     {
+                         "text": "Phineas finally said, his laughter"
+                                 "subsiding."
+                     },
+                     {
+                         "text": "Do you accept the challenge? Ha ha ha! Hee "
+                                 "hee! Ah, ha ha! Hilarious!"
+                     }
+                 ],
+                 story_line_visited=[
+                     {
+                         "text": "Hey, welcome back, Charlie! Are you ready "
+                                 "this time to take on the challenge? Can we "
+                                 "fight? Ha ha ha! Sorry.",
+                     },
+                 ],
+                 story_line_fought=[
+                     {
+                         "text": "Ah, Charlie, back for another round, I "
+                                 "see. Ready to continue where we left off, "
+                                 "or have you come to reconsider? The "
+                                 "challenge 'awaits.",
+                     },
+                 ],
+                 story_line_won_fight=[
+                     {
+                         "text": "You have defeated Phineas Blackthorn. With "
+                                 "a gracious nod and a smile, Phineas "
+                                 "Blackthorn conceded."
+                     },
+                     {
+                         "text": "Well done, Charlie. You've proven "
+                                 "yourself worthy. You can now go and take "
+                                 "the Time Crystal; you have earned it."
+                     },
+                     {
+                         "item": Special(
+                             name="The Time Crystal",
+                             received="You have received the Time Crystal.",
+                             description="A radiant crystal that pulses with "
+                                         "the essence of time itself. Its "
+                                         "luminous glow is a testament to its "
+                                         "ancient power.",
+                             story_line=[
+                                 {
+                                     "text": "As Charlie holds the Time "
+                                             "Crystal, its pulsating light "
+                                             "syncs with his heartbeat, a "
+                                             "tangible rhythm of time itself. "
+                                             "'This... this crystal is the "
+                                             "heartbeat of the universe,' he "
+                                             "whispers, marveling at the "
+                                             "intricate patterns of light "
+                                             "dancing within."
+                                 },
+                                 {
+                                     "text": "With every pulse, visions of "
+                                             "past and future flicker before "
+                                             "him, a myriad of possibilities "
+                                             "contained within the crystal's "
+                                             "glow. 'To think, the key to "
+                                             "reviving the Grand Clock lies "
+                                             "within this small crystal,' "
+                                             "Charlie muses, a sense of "
+                                             "responsibility settling over "
+                                             "him."
+                                 },
+                                 {
+                                     "text": "'Time weaves the fabric of our "
+                                             "universe, and this crystal... "
+                                             "it's a thread in that "
+                                             "tapestry,' Charlie realizes. 'I "
+                                             "must deliver it to the "
+                                             "Timekeeper. Only then can we "
+                                             "mend the tear in our world's "
+                                             "fabric caused by the cessation "
+                                             "of the Grand Clock.'"
+                                 }
+                             ]
+                         )
+                     }
+                 ],
+                 story_line_lost_fight=[
+                     {
+                         "text": "Phineas Blackthorn couldn't help but raise "
+                                 "an eyebrow and quip"
+                     },
+                     {
+                         "text": "Well, Charlie, I suppose you'll have to "
+                                 "stick to egg-citing adventures for now. The "
+                                 "Time Crystal remains elusive, like a "
+                                 "chicken chasing its tail "
+                     },
+                     {
+                         "text": "Game Over!",
+                     },
+                     {
+                         "continue": True
+                     },
+                     {
+                         "gameover": True
+                     }
+                 ],
+                 story_line_defeated=[
+                     {
+                         "text": "What else do you need, Charlie? You've "
+                                 "already bested me in our challenge, and I "
+                                 "have no more tests to offer.",
+                     },
+                 ],
+                 health=50,
+                 attack=40,
+                 defense=20
+             ),
+             position=(3, 1),
+             ),
+        Area(name="Yonder Forest",
+             story_line=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "Yonder Forest loomed ahead, a dense canopy "
+                             "of ancient trees whispering secrets from "
+                             "centuries past. Its shadowy depths, untouched "
+                             "by time, held both allure and mystery. "
+                 },
+                 {
+                     "text": "Charlie paused at the forest's edge, the a "
+                             "cool shade brushing against his feathers like "
+                             "promise of the unknown. 'This forest has seen "
+                             "more seasons than we can fathom,' he thought, "
+                             "'each tree a silent guardian of history.' "
+                 },
+                 {
+                     "text": "I better keep moving and make it through to "
+                             "this forest before night falls. It's wise not "
+                             "linger here when the shadows grow long. There's "
+                             "no telling what lurks in the dark. "
+                 },
+                 {
+                     "text": "Taking a deep breath, Charlie stepped "
+                             "forward. The forest floor felt soft underfoot, "
+                             "inviting him deeper into the green shadows."
+                 },
+                 {
+                     "continue": True
+                 }
+             ],
+             story_line_visited=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "You are back in Yonder Forest",
+                 }
+             ],
+             enemy=Enemy(
+                 name="Shadow Stalker",
+                 story_line=[
+                     {
+                         "text": "You've entered my domain, little But It "
+                                 "chicken. know this, none shall cross these "
+                                 "woods without challenging me. is the law of "
+                                 "the shadows. "
+                     },
+                     {
+                         "text": "The Shadow Stalker's voice was echoing "
+                                 "chilling, through the darkened forest, "
+                                 "causing the leaves to shiver and the air to "
+                                 "grow heavy with tension. Charlie stood "
+                                 "firm, ready to face the impending "
+                                 "challenge. "
+                     },
+                     {
+                         "text": "Why do you enforce such a law, Shadow "
+                                 "Stalker? What drives you to demand "
+                                 "challenges from those who enter?"
+                     },
+
+                     {
+                         "text": "I seek to prove my dominance, Charlie. "
+                                 "I crave the thrill of battle and the taste "
+                                 "of victory. The law of the shadows is my "
+                                 "way, and you, by entering, have accepted "
+                                 "the challenge. "
+                     }
+                 ],
+                 story_line_visited=[
+                     {
+                         "text": "You're back, Charlie. I hope you brought "
+                                 "your feather duster this time!"
+                     },
+                 ],
+                 story_line_fought=[
+                     {
+                         "text": "You've returned, Charlie. Ready to face me "
+                                 "again?"
+                     },
+                 ],
+                 story_line_won_fight=[
+                     {
+                         "text": "You have defeated the Shadow Stalker."
+                     },
+                     {
+                         "text": "The creature vanished into the shadows, "
+                                 "defeated. As the darkness receded, a faint "
+                                 "whisper reached Charlie's ears."
+                     },
+                     {
+                         "text": "You may have bested me, but your quest "
+                                 "is far from over, Charlie. Seek the mighty "
+                                 "Feathered Blade that once belonged to the "
+                                 "legendary warrior, Sir Cluckington. The "
+                                 "elusive Feathered Blade can be found "
+                                 "concealed within the depths of the Yonder "
+                                 "Forest, waiting for a worthy owner."
+                     },
+                     {
+                         "text": "The creature vanished into the shadows, "
+                                 "defeated. As the darkness receded, a faint "
+                                 "whisper reached Charlie's ears."
+                     }
+                 ],
+                 story_line_lost_fight=[
+                     {
+                         "text": "The Shadow Stalker's eyes gleamed with "
+                                 "malice as it spoke."
+                     },
+                     {
+                         "text": "You're no match for me, little chicken. "
+                                 "You'll never leave this forest."
+                     },
+                     {
+                         "text": "Game Over!",
+                     },
+                     {
+                         "continue": True
+                     },
+                     {
+                         "gameover": True
+                     }
+                 ],
+                 story_line_defeated=[
+                     {
+                         "text": "You've defeated me, Charlie. I have no "
+                                 "more fight left in me."
+                     },
+                 ],
+                 health=30,
+                 attack=5,
+                 defense=30
+             ),
+             items=[
+                 Weapon(
+                     name="Feathered Blade",
+                     description="A blade made from the finest feathers, "
+                                 "light and sharp.",
+                     attack=18
+                 ),
+             ],
+             ),
+        Area(name="Clucker's Canyon",
+             story_line=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "Clucker's Canyon, with its echoing walls is "
+                             "and towering red cliffs, a marvel of nature on "
+                             "Yolkaris. The canyon has witnessed the rise and "
+                             "fall of many civilizations, holding secrets of "
+                             "the past within its rugged landscape. It's said "
+                             "that the echoes in the canyon are the voices of "
+                             "ancient Yolkarians. "
+                 },
+                 {
+                     "text": "The canyon is not just a historical site a "
+                             "but also treasure trove of mystery. Explorers "
+                             "and treasure hunters often delve into its "
+                             "depths, seeking lost artifacts of the chicken "
+                             "civilizations that once flourished here. "
+                 },
+                 {
+                     "text": "I wonder what stories these cliffs could tell "
+                             "if they could talk. Ancient voices... I hope "
+                             "they can guide me on my quest. Mystery and "
+                             "treasure... sounds like an adventure waiting to "
+                             "happen. Lost artifacts... maybe they hold clues "
+                             "about The Time Crystal. "
+                 }
+             ],
+             story_line_visited=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "You are back in Clucker's Canyon",
+                 }
+             ],
+             items=[
+                 Potion(
+                     name="Medium Potion",
+                     health=50
+                 )
+             ],
+             ),
+        Area(name="Bubble Beach",
+             story_line=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "As Charlie steps onto the shimmering sands of "
+                             "Bubble Beach, he's greeted by the sight of "
+                             "luminous bubbles, each encasing miniature "
+                             "galaxies. The serene dance of these celestial "
+                             "orbs against the backdrop of the cosmic sea is "
+                             "breathtaking."
+                 },
+                 {
+                     "text": "Charlie, mesmerized, whispers to himself, "
+                             "'Each of these bubbles holds a universe within, "
+                             "a reminder of the infinite wonders beyond our "
+                             "reach. It's a humbling sight.'"
+                 },
+                 {
+                     "text": "'And yet,' Charlie ponders aloud, 'it's "
+                             "remarkable to think that even here, amidst the "
+                             "vastness of space, something as small as a "
+                             "bubble can capture the essence of the cosmos. "
+                             "It shows that beauty and mystery lie in every "
+                             "corner of the universe, waiting to be "
+                             "discovered.'"
+                 },
+                 {
+                     "continue": True
+                 },
+                 {
+                     "text": "Lost in thought, he reaches out to gently touch "
+                             "a bubble. As it bursts, releasing a faint, "
+                             "starry glow, Charlie smiles. 'Even the smallest "
+                             "things,' he concludes, 'can hold the grandest "
+                             "of mysteries. It's a reminder that we all have "
+                             "a place in this vast, beautiful cosmos, no "
+                             "matter how small we may seem.'"
+                 }
+             ],
+             story_line_visited=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "You are back in Bubble Beach",
+                 }
+             ],
+             items=[
+                 Potion(
+                     name="Small Potion",
+                     health=25
+                 )
+             ],
+             ),
+        Area(name="Peckers Peak",
+             story_line=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "Peckers Peak, the crowning glory of stands "
+                             "Yolkaris, tall, its heights veiled in the "
+                             "whispers of ancient tales. This revered summit, "
+                             "where the skies kiss the earth, was once the "
+                             "sacred observatory of the elder chickens. "
+                 },
+                 {
+                     "text": "Here, under the canvas of the cosmos, they "
+                             "unraveled the mysteries of the stars, leaving a "
+                             "legacy etched in the winds. As Charlie's path "
+                             "ascends, each step is a journey through time. "
+                 },
+                 {
+                     "text": "The winds carry legends, and the stones "
+                             "are etched with the wisdom of ages. Reaching the"
+                             " peak, Charlie is enveloped in a world of awe, "
+                             "the horizon stretching infinitely."
+                 },
+                 {
+                     "text": "The air is thick with the essence of "
+                             "bygone eras, and the silence speaks of hidden "
+                             "truths. Atop this celestial altar, where the "
+                             "ancient chickens once gazed upon the heavens."
+                 },
+                 {
+                     "continue": True
+                 },
+                 {
+                     "text": "Charlie feels an overwhelming connection "
+                             "to the stars. Their ancient wisdom, like a "
+                             "forgotten song, resonates within him, guiding "
+                             "his heart. The whispers of Peckers Peak instill "
+                             "in him a sense of purpose."
+                 },
+                 {
+                     "text": "Wow, the view from here is incredible! I of "
+                             "can see the whole Yolkaris and Crystal Hills. "
+                             "It's said that the ancient chickens gazed at "
+                             "the stars from here, plotting their courses "
+                             "across the skies. If only I had their knowledge "
+                             "now... "
+                 },
+                 {
+                     "continue": True
+                 }
+             ],
+             story_line_visited=[
+                 {
+                     "clear": True
+                 },
+                 {
+                     "text": "You are back in Peckers Peak",
+                 }
+             ],
+             enemy=Enemy(
+                 name="Viktor Thornhart",
+                 story_line=[
+                     {
+                         "text": "You've ventured into my territory, "
+                                 "stranger. Prepare to face the consequences."
+                     },
+                     {
+                         "text": "Who are you, and why do you guard this "
+                                 "place?"
+                     },
+                     {
+                         "text": "I am Viktor Thornhart, protector of "
+                                 "these hallowed grounds. The secrets hidden "
+                                 "here are not for the untested. If you wish "
+                                 "to proceed, you must prove your worth."
+                     },
+                     {
+                         "text": "The tension in the air thickens as"
+                                 "you prepare to face Viktor, the enigmatic"
+                                 "guardian of these sacred grounds."
+                     }
+                 ],
+                 story_line_visited=[
+                     {
+                         "text": "You've returned, Charlie. Ready to face me "
+                                 "again?"
+                     },
+                 ],
+                 story_line_fought=[
+                     {
+                         "text": "You've returned, Charlie. Ready to face me "
+                                 "again?"
+                     },
+                 ],
+                 story_line_won_fight=[
+                     {
+                         "text": "With a final, determined effort, you"
+                                 "overcome Viktor Thornhart's defenses. "
+                                 "'You've proven your mettle, Charlie. I "
+                                 "yield.' Viktor's stern demeanorc softens, "
+                                 "acknowledging your strength."
+                     },
+                     {
+                         "text": "`I'll share a secret with you, "
+                                 "Charlie. In the heart of these peaks, "
+                                 "you'll find the Feathered Armor.`"
+                     },
+                     {
+                         "text": "Viktor's words pique your curiosity "
+                                 "as he reveals the existence of the finest "
+                                 "armor, crafted from the lightest and "
+                                 "strongest feathers known."
+                     }
+                 ],
+                 story_line_lost_fight=[
+                     {
+                         "text": "Viktor Thornhart's eyes gleamed with malice "
+                                 "as he spoke."
+                     },
+                     {
+                         "text": "You're no match for me, little chicken. "
+                                 "You'll never leave this place."
+                     },
+                     {
+                         "text": "Game Over!",
+                     },
+                     {
+                         "continue": True
+                     },
+                     {
+                         "gameover": True
+                     }
+                 ],
+                 story_line_defeated=[
+                     {
+                         "text": "You've defeated me, Charlie. I have no more "
+                                 "fight left in me."
+                     },
+                 ],
+                 health=30,
+                 attack=5,
+                 defense=30
+             ),
+             items=[
+                 Armour(
+                     name="Feathered Armor",
+                     description="Armor made from the finest feathers, light "
+                                 "and strong.",
+                     defense=20
+                 ),
+             ]
+             )
+    ]
+}
@@ -0,0 +1,296 @@
+import argparse
+import os
+import random
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from math import ceil
+
+from utils import NullPort, current_port
+from .game_manager import GameManager
+from .odds import warm_odds
+from .world import load_template
+
+# Moves the explorer picks from at the main prompt.
+MOVES = ["north", "south", "east", "west"]
+
+# Colour and cursor escape sequences, removed before reading prompts.
+ESCAPES = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+
+class ScriptPort(NullPort):
+    """
+    Port of a game played without anyone at the keyboard. Prompts are
+    answered from a script first, then by a policy once the script runs
+    out. Raises EOFError when neither has an answer, or when the game asked
+    for more inputs than allowed.
+    - lines: the answers to give, in order
+    - policy: called with the output written since the last prompt and the
+      game being played, returns the answer
+    - manager: the game manager running the game the policy plays
+    - max_inputs: the number of answers after which the game is abandoned
+    """
+
+    def __init__(self, lines=None, policy=None, manager=None,
+                 max_inputs: int = 5000) -> None:
+        super().__init__(lines)
+        self.policy = policy
+        self.manager = manager
+        self.max_inputs = max_inputs
+        self.inputs = 0
+        self.pending = []
+
+    def write(self, data) -> None:
+        if self.policy:
+            self.pending.append(data)
+
+    def read_line(self) -> str:
+        self.inputs += 1
+        if self.inputs > self.max_inputs:
+            raise EOFError()
+        if self.lines:
+            self.pending.clear()
+            return self.lines.pop(0)
+        if not self.policy:
+            raise EOFError()
+        output = ''.join(self.pending)
+        self.pending.clear()
+        game = self.manager.game if self.manager else None
+        return self.policy(output, game)
+
+
+class Explorer:
+    """
+    Policy that plays the game like a curious player: it wanders around,
+    searches areas, picks up everything, fights everyone, retreats and drinks
+    a potion when its health runs low.
+    - level: the game level to select
+    - seed: the seed of its random choices
+    """
+
+    def __init__(self, level: int = 1, seed=None) -> None:
+        self.level = level
+        self.rng = random.Random(seed)
+
+    def __call__(self, output: str, game) -> str:
+        output = ESCAPES.sub("", output)
+        lines = [line for line in output.splitlines() if line.strip()]
+        prompt = lines[-1] if lines else ""
+        if "username" in prompt:
+            return "Charlie"
+        if "Select a game" in prompt:
+            return str(self.level)
+        if "'fight' or 'retreat'" in prompt:
+            return "fight"
+        if "enter or 'retreat'" in prompt:
+            low = game and game.player and game.player.health < 30
+            return "retreat" if low else ""
+        if "'use' or 'inspect'" in prompt:
+            return "u"
+        if "Do you want to" in prompt or "'yes' or 'no'" in prompt:
+            return "yes"
+        if "Where do you want to go" in prompt:
+            choices = re.findall(r"^\s*(\d+)\. ", output, re.MULTILINE)
+            return self.rng.choice(choices) if choices else "0"
+        if "number" in prompt:
+            return "1"
+        if prompt.strip().startswith(">>"):
+            return self.action(game)
+        return ""
+
+    def action(self, game) -> str:
+        """
+        Returns the command to run at the main prompt.
+        """
+        player = game.player if game else None
+        if player and player.potions and player.health < 40:
+            return "p"
+        roll = self.rng.random()
+        if player and player.inventory and roll < 0.1:
+            return "i"
+        if roll < 0.4:
+            return "search"
+        return self.rng.choice(MOVES)
+
+
+def play_game(level: int = 1, script=None, policy=None,
+              max_inputs: int = 5000, seed=None) -> dict:
+    """
+    Plays one game without delays and returns how it went: its outcome
+    ('won', 'lost' or 'unfinished'), the inputs it took and the health the
+    player was left with.
+    - level: the game level the default policy selects
+    - script: the answers to give before the policy takes over
+    - policy: the policy answering the prompts (defaults to an Explorer,
+      False to only play the script)
+    - max_inputs: the number of answers after which the game is abandoned
+    - seed: the seed of the game and of the default policy
+    """
+    if policy is None:
+        policy = Explorer(level, seed)
+
+    manager = GameManager(replay=False)
+    port = ScriptPort(script, policy, manager, max_inputs)
+    token = current_port.set(port)
+    try:
+        manager.start_game(port, seed)
+        finished = True
+    except EOFError:
+        finished = False
+    finally:
+        current_port.reset(token)
+
+    player = manager.game.player if manager.game else None
+    if not finished or player is None:
+        outcome = "unfinished"
+    elif player.health > 0:
+        outcome = "won"
+    else:
+        outcome = "lost"
+    return {
+        "outcome": outcome,
+        "inputs": port.inputs,
+        "health": player.health if player else None
+    }
+
+
+def new_histograms() -> dict:
+    """
+    Returns empty histograms of game results: outcomes, inputs taken (in
+    tens) and health left.
+    """
+    return {"outcomes": Counter(), "inputs": Counter(), "health": Counter()}
+
+
+def play_shard(level: int, first_seed: int, games: int, script=None,
+               policy=None, max_inputs: int = 5000) -> dict:
+    """
+    Plays a run of games seeded first_seed, first_seed + 1 and so on, and
+    returns the histograms of their results. Every game is seeded on its
+    own, so results do not depend on how games are split between workers.
+    """
+    histograms = new_histograms()
+    for seed in range(first_seed, first_seed + games):
+        result = play_game(level, script, policy, max_inputs, seed)
+        histograms["outcomes"][result["outcome"]] += 1
+        histograms["inputs"][result["inputs"] // 10 * 10] += 1
+        histograms["health"][result["health"]] += 1
+    return histograms
+
+
+def merge_histograms(histograms: dict, shard: dict) -> None:
+    """
+    Adds the histograms of a shard to the totals.
+    """
+    for name, counts in shard.items():
+        histograms[name].update(counts)
+
+
+def report(games: int, histograms: dict, elapsed: float) -> dict:
+    """
+    Returns the results of a batch along with its throughput.
+    """
+    return {
+        "games": games,
+        "outcomes": dict(histograms["outcomes"]),
+        "inputs": dict(histograms["inputs"]),
+        "health": dict(histograms["health"]),
+        "seconds": elapsed,
+        "games_per_second": games / elapsed if elapsed else float('inf')
+    }
+
+
+def run_batch(games: int, level: int = 1, script=None, policy=None,
+              max_inputs: int = 5000, seed: int = 0) -> dict:
+    """
+    Plays a batch of games in this process and returns the histograms of
+    their results, along with the throughput in games per second.
+    - games: the number of games to play
+    - seed: the seed of the first game, the next ones counting up from it
+    """
+    started = time.perf_counter()
+    histograms = play_shard(level, seed, games, script, policy, max_inputs)
+    return report(games, histograms, time.perf_counter() - started)
+
+
+def run_farm(games: int, level: int = 1, workers=None, script=None,
+             policy=None, max_inputs: int = 5000, seed: int = 0,
+             shard_size: int = None) -> dict:
+    """
+    Plays a batch of games on every core, in shards of consecutive seeds,
+    and returns the merged histograms like run_batch. The results are the
+    same as run_batch's for the same seed, whatever the number of workers.
+    - workers: the number of worker processes (defaults to one per core)
+    - policy: the policy playing the games, which must be picklable
+    - shard_size: the number of games sent to a worker at once (defaults
+      to about four shards per worker, so every worker gets some)
+    """
+    # Forked workers inherit the loaded templates and odds tables instead
+    # of each building their own copy
+    load_template(level)
+    warm_odds(level)
+
+    workers = workers or os.cpu_count() or 1
+    shard_size = shard_size or max(ceil(games / (workers * 4)), 1)
+    histograms = new_histograms()
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        shards = [
+            pool.submit(play_shard, level, first_seed,
+                        min(shard_size, seed + games - first_seed),
+                        script, policy, max_inputs)
+            for first_seed in range(seed, seed + games, shard_size)
+        ]
+        for shard in as_completed(shards):
+            merge_histograms(histograms, shard.result())
+    return report(games, histograms, time.perf_counter() - started)
+
+
+def read_script(path: str) -> list:
+    """
+    Returns the answers of a script file, one per line. Empty lines answer
+    with enter.
+    """
+    with open(path, encoding="utf-8") as script:
+        return script.read().splitlines()
+
+
+def print_report(level: int, report: dict) -> None:
+    """
+    Prints the results of a batch.
+    """
+    outcomes = ", ".join(f"{outcome}: {count}" for outcome, count
+                         in sorted(report["outcomes"].items()))
+    print(f"Level {level}: {report['games']} games in "
+          f"{report['seconds']:.2f}s "
+          f"({report['games_per_second']:.0f} games/s) - {outcomes}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Play Yolkaris Odyssey games without a player.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--level", type=int, nargs="+", default=[1, 2],
+                        help="game levels to play")
+    parser.add_argument("--script",
+                        help="file of answers, one per line, played before "
+                             "the explorer takes over")
+    parser.add_argument("--script-only", action="store_true",
+                        help="end the game when the script runs out")
+    parser.add_argument("--max-inputs", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes, 0 for one per core")
+    args = parser.parse_args()
+
+    answers = read_script(args.script) if args.script else None
+    explorer = False if args.script_only else None
+    for game_level in args.level:
+        if args.workers == 1:
+            batch = run_batch(args.games, game_level, answers, explorer,
+                              args.max_inputs, args.seed)
+        else:
+            batch = run_farm(args.games, game_level, args.workers or None,
+                             answers, explorer, args.max_inputs, args.seed)
+        print_report(game_level, batch)
@@ -0,0 +1,150 @@
+import os
+import re
+import secrets
+import tempfile
+import time
+
+from utils import text, write, get_port, color_error
+from . import snapshot
+from .game_manager import SessionRecovery
+
+# Folder the games of idle players are saved to until they come back.
+SESSIONS_DIR = os.environ.get(
+    "YOLKARIS_SESSIONS",
+    os.path.join(tempfile.gettempdir(), "yolkaris-sessions"))
+
+# Saved games not resumed within this many seconds are deleted.
+MAX_AGE = 7 * 24 * 60 * 60
+
+# A session token is 12 hexadecimal characters.
+TOKEN = re.compile(r"[0-9a-f]{12}")
+
+# Hands the token to the web client, which keeps it to resume the game on
+# its next connection. Terminals ignore unknown OSC sequences.
+TOKEN_SEQUENCE = "\033]7777;yolkaris-session={}\007"
+
+
+def session_path(token: str) -> str:
+    """
+    Returns the path of the saved game of a session token.
+    """
+    return os.path.join(SESSIONS_DIR, f"{token}.snapshot")
+
+
+def prune(now=None) -> None:
+    """
+    Deletes the saved games that were not resumed in time.
+    """
+    now = now if now is not None else time.time()
+    try:
+        names = os.listdir(SESSIONS_DIR)
+    except FileNotFoundError:
+        return
+    for name in names:
+        path = os.path.join(SESSIONS_DIR, name)
+        try:
+            if now - os.path.getmtime(path) > MAX_AGE:
+                os.unlink(path)
+        except OSError:
+            pass
+
+
+def hibernate(game, token: str = None, data: bytes = None) -> str:
+    """
+    Saves the game of an idle player so its process or task can be freed,
+    and returns the session token that resumes it.
+    - token: the token of the session (defaults to a new one)
+    - data: the snapshot to save (defaults to one of the game as it is)
+    """
+    if data is None:
+        data = snapshot.save(game)
+    os.makedirs(SESSIONS_DIR, exist_ok=True)
+    prune()
+    token = token or secrets.token_hex(6)
+    path = session_path(token)
+    # Write next to the target and rename, so a crash never leaves half a
+    # snapshot behind
+    partial = f"{path}.{os.getpid()}.tmp"
+    with open(partial, "wb") as file:
+        file.write(data)
+    os.replace(partial, path)
+    game.token = token
+    return token
+
+
+def rehydrate(token: str):
+    """
+    Returns the saved game of a session token and forgets it, so a token
+    resumes a game once. Returns None if there is no such game.
+    """
+    if not TOKEN.fullmatch(token):
+        return None
+    path = session_path(token)
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+        os.unlink(path)
+    except OSError:
+        return None
+    return data
+
+
+def resume_token(answer: str):
+    """
+    Returns the token of a 'resume <token>' answer, or None if the answer
+    is something else.
+    """
+    words = answer.split()
+    if len(words) == 2 and words[0].lower() == "resume":
+        return words[1].lower()
+    return None
+
+
+def resume(game, token: str) -> bool:
+    """
+    Restores the saved game of a session token into a new game. Shows why
+    it can't be resumed otherwise. Returns whether the game was restored.
+    Raises SessionRecovery when the token is of a session that ended
+    without saving, to rebuild it from its journal.
+    """
+    from .journal import Journal
+
+    journal = get_port(game.port).journal
+    if journal is not None and journal.replaying:
+        # The saved game is gone once resumed, the journal kept a copy
+        data = journal.replay_snapshot()
+    else:
+        data = rehydrate(token)
+        if data is None and (journal is None or journal.token != token):
+            recovered = Journal.open(token)
+            if recovered is not None:
+                raise SessionRecovery(recovered)
+        if data is not None and journal is not None:
+            journal.record_snapshot(data)
+    if data is None:
+        text("There is no saved game for this session.", color=color_error,
+             port=game.port)
+        return False
+    try:
+        snapshot.restore(game, data)
+    except snapshot.SnapshotError as error:
+        text(f"The saved game can't be resumed: {error}.",
+             color=color_error, port=game.port)
+        game.player = None
+        game.level = None
+        game.location_objects = {}
+        return False
+    return True
+
+
+def announce(token: str, port=None) -> None:
+    """
+    Tells the player their game was saved and how to carry on with it. The
+    session ends right after, so nothing is delayed.
+    """
+    text(" ", delay=0, port=port)
+    text("You were away for a while, so your game was saved.", delay=0,
+         port=port)
+    text(f"Enter 'resume {token}' as your username to carry on.", delay=0,
+         port=port)
+    write(TOKEN_SEQUENCE.format(token), flush=True, port=port)
@@ -2,6 +2,7 @@ import random
 from utils import (clear_terminal, paragraph, text, ask_user, add_space)
 from .items import Weapon, Armour, Potion, Book, Special, Item
 from .game_manager import game_manager
+from .odds import fight_odds
 
 
 class Interaction:
@@ -9,8 +10,10 @@ class Interaction:
     Handles the interaction between the player and the game elements.
     """
 
-    def __init__(self, player):
+    def __init__(self, player, port=None, rng=None):
         self.player = player
+        self.port = port
+        self.rng = rng if rng is not None else random.Random()
 
     def equip(self, item, item_type):
         """
@@ -20,14 +23,14 @@ class Interaction:
             setattr(self.player, item_type, None)
             return
         if item.received:
-            paragraph(f"{item.received}", space=1)
+            paragraph(f"{item.received}", space=1, port=self.port)
         else:
             msg = (f"You have received "
                    f"'{item.name}'." if item_type == 'armour' else f"You "
                    f"have received the '{item.name}'.")
-            paragraph(msg, space=1)
+            paragraph(msg, space=1, port=self.port)
         if item.description:
-            paragraph(item.description, space=1)
+            paragraph(item.description, space=1, port=self.port)
         setattr(self.player, item_type, item)
 
     def add_new_item(self, item):
@@ -41,31 +44,33 @@ class Interaction:
             self.equip(item, 'armour')
 
         elif isinstance(item, Potion):
-            paragraph(f"You have received {item.name}.", space=1)
+            paragraph(f"You have received {item.name}.", space=1,
+                      port=self.port)
             if item.description:
-                paragraph(item.description, space=1)
+                paragraph(item.description, space=1, port=self.port)
             self.player.potions.append(item)
 
         elif isinstance(item, Book):
             if item.received:
-                paragraph(f"{item.received}", space=1)
+                paragraph(f"{item.received}", space=1, port=self.port)
             else:
-                paragraph(f"You have received a book: '{item.name}'.", space=1)
+                paragraph(f"You have received a book: '{item.name}'.", space=1,
+                          port=self.port)
             self.player.inventory.append(item)
 
         elif isinstance(item, Special):
             if item.received:
-                paragraph(f"{item.received}", space=1)
+                paragraph(f"{item.received}", space=1, port=self.port)
             self.player.inventory.append(item)
 
         elif isinstance(item, Item):
             if item.received:
-                paragraph(f"{item.received}", space=1)
+                paragraph(f"{item.received}", space=1, port=self.port)
             else:
                 paragraph(f"You have received an item: '{item.name}'.",
-                          space=1)
+                          space=1, port=self.port)
             if item.description:
-                paragraph(item.description, space=1)
+                paragraph(item.description, space=1, port=self.port)
             self.player.inventory.append(item)
 
     def print_story_line(self, story_line):
@@ -77,21 +82,22 @@ class Interaction:
             delay = line['delay'] if 'delay' in line else 0.2
             color = line['color'] if 'color' in line else None
             if 'clear' in line:
-                clear_terminal()
+                clear_terminal(port=self.port)
             elif 'text' in line:
-                paragraph(line['text'], space=space, color=color, delay=delay)
+                paragraph(line['text'], space=space, color=color, delay=delay,
+                          port=self.port)
             elif 'continue' in line:
-                ask_user('continue', space=space)
+                ask_user('continue', space=space, port=self.port)
             elif 'item' in line:
                 self.add_new_item(line['item'])
             elif 'gameover' in line:
-                game_manager.reset_game()
+                game_manager.game_over()
 
     def with_area(self, area, visited):
         """
         Handles the interaction with an area.
         """
-        add_space()
+        add_space(port=self.port)
         if not visited:
             self.print_story_line(area.story_line)
         else:
@@ -127,7 +133,7 @@ class Interaction:
             self.print_story_line(enemy.story_line)
             text(f"{enemy.name} stats - health: {enemy.health}, "
                  f" attack: {enemy.attack}, "
-                 f"defense: {enemy.defense}", space=1)
+                 f"defense: {enemy.defense}", space=1, port=self.port)
         else:
             if enemy.health <= 0:
                 self.print_story_line(enemy.story_line_defeated)
@@ -137,37 +143,53 @@ class Interaction:
                 text(
                     f"{enemy.name} stats - health: {enemy.health}, "
                     f"attack: {enemy.attack}, "
-                    f"defense: {enemy.defense}", space=1)
+                    f"defense: {enemy.defense}", space=1, port=self.port)
             else:
                 self.print_story_line(enemy.story_line_visited)
                 text(
                     f"{enemy.name} stats - health: {enemy.health}, "
                     f"attack: {enemy.attack}, "
-                    f"defense: {enemy.defense}", space=1)
+                    f"defense: {enemy.defense}", space=1, port=self.port)
 
-        combat = Combat(self.player, enemy)
+        self.show_odds(enemy)
+        combat = Combat(self.player, enemy, port=self.port, rng=self.rng)
         results = combat.to_fight_or_not_to_fight()
         if results == "retreat":
-            text("You have retreated from the battle.")
+            text("You have retreated from the battle.", port=self.port)
             location.return_to_previous_position()
             return False
         elif results == "won":
-            text(f"You have defeated {enemy.name}!", space=1)
+            text(f"You have defeated {enemy.name}!", space=1, port=self.port)
             self.print_story_line(enemy.story_line_won_fight)
             return True
         elif results == "lost":
-            text(f"You have been defeated by {enemy.name}!", space=1)
+            text(f"You have been defeated by {enemy.name}!", space=1,
+                 port=self.port)
             self.print_story_line(enemy.story_line_lost_fight)
 
+    def show_odds(self, enemy, odds=None):
+        """
+        Shows the player's exact odds of winning a fight with the enemy,
+        and the potions they can expect to need after it.
+        - odds: the odds of the fight, if already computed
+        """
+        odds = odds or fight_odds(self.player, enemy)
+        hint = f"Your odds: {odds['win']:.0%} to win"
+        if odds['win']:
+            hint += f", about {odds['potions']:.1f} potions to heal up after"
+        text(hint + ".", space=1, port=self.port)
+
 
 class Combat:
     """
     Handles the combat between the player and an enemy.
     """
 
-    def __init__(self, player, enemy):
+    def __init__(self, player, enemy, port=None, rng=None):
         self.player = player
         self.enemy = enemy
+        self.port = port
+        self.rng = rng if rng is not None else random.Random()
 
     def combat(self):
         """
@@ -194,7 +216,7 @@ class Combat:
         """
         Handles the decision to fight or retreat.
         """
-        if ask_user('combat'):
+        if ask_user('combat', port=self.port):
             result = self.combat()
             return result
         else:
@@ -204,7 +226,7 @@ class Combat:
         """
         Prompts the player to continue or flee the battle.
         """
-        return ask_user('retreat')
+        return ask_user('retreat', port=self.port)
 
     def player_attack(self):
         """
@@ -213,7 +235,7 @@ class Combat:
         player_attack_power = self.calculate_player_attack_power()
         damage = self.calculate_damage(player_attack_power, self.enemy.defense)
         self.enemy.health -= damage
-        text(f"You hit the enemy causing {damage} damage.")
+        text(f"You hit the enemy causing {damage} damage.", port=self.port)
 
     def enemy_attack(self):
         """
@@ -223,7 +245,7 @@ class Combat:
             self.enemy.attack, self.calculate_player_defense()
         )
         self.player.health -= damage
-        text(f"Enemy hits you causing {damage} damage.")
+        text(f"Enemy hits you causing {damage} damage.", port=self.port)
 
     def calculate_player_attack_power(self):
         """
@@ -246,14 +268,15 @@ class Combat:
         Calculates the damage caused by the attack.
         """
         return max(
-            int(random.uniform(0.5 * attack, attack) -
-                random.uniform(0, defense)), 1
+            int(self.rng.uniform(0.5 * attack, attack) -
+                self.rng.uniform(0, defense)), 1
         )
 
     def display_combat_status(self):
         """
         Displays the combat status.
         """
-        text(f"Player: health:{self.player.health}")
+        text(f"Player: health:{self.player.health}", port=self.port)
         if self.enemy.health > 0:
-            text(f"Enemy: health:{self.enemy.health}", delay=0.3, space=1)
+            text(f"Enemy: health:{self.enemy.health}", delay=0.3, space=1,
+                 port=self.port)
@@ -3,6 +3,8 @@ class Item:
     Initializes an item in the game.
     """
 
+    __slots__ = ("name", "description", "received")
+
     def __init__(
             self,
             name: str,
@@ -19,6 +21,8 @@ class Weapon(Item):
     Initializes a weapon in the game.
     """
 
+    __slots__ = ("attack",)
+
     def __init__(
             self,
             name: str,
@@ -34,6 +38,8 @@ class Armour(Item):
     Initializes an armour in the game.
     """
 
+    __slots__ = ("defense",)
+
     def __init__(
             self,
             name: str,
@@ -49,6 +55,8 @@ class Potion(Item):
     Initializes a potion in the game.
     """
 
+    __slots__ = ("health",)
+
     def __init__(
             self,
             name: str,
@@ -62,6 +70,8 @@ class Book(Item):
     Initializes a book in the game.
     """
 
+    __slots__ = ("story_line",)
+
     def __init__(
             self,
             name: str,
@@ -77,6 +87,8 @@ class Spaceship(Item):
     Initializes a spaceship in the game.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, description: str) -> None:
         super().__init__(name, description)
 
@@ -86,6 +98,8 @@ class Special(Item):
     Initializes a special item in the game.
     """
 
+    __slots__ = ("story_line",)
+
     def __init__(self, name: str, description: str = None,
                  story_line: list = None, received: str = None) -> None:
         super().__init__(name, description, received)
@@ -0,0 +1,340 @@
+import os
+import secrets
+import threading
+import time
+
+from utils import InstantClock, text, write
+from .hibernate import SESSIONS_DIR, TOKEN, TOKEN_SEQUENCE, prune
+from .snapshot import Reader, SnapshotError, write_varint
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# First bytes of every journal, followed by the format version.
+MAGIC = b"YJ"
+VERSION = 1
+
+# Kinds of entries: an answer to a prompt, a 'continue' prompt skipped
+# because answers were typed ahead, and a saved game the session resumed.
+ANSWER = 0
+SKIP = 1
+SNAPSHOT = 2
+
+# Seconds between two syncs of a journal to disk. Entries reach the
+# operating system as soon as they are recorded, so they survive the game
+# process being killed; syncing only guards against the machine crashing.
+SYNC_INTERVAL = 1.0
+
+
+class Syncer:
+    """
+    Syncs the journals that changed to disk from a background thread, so
+    the player never waits for the disk.
+    """
+
+    def __init__(self, interval: float = SYNC_INTERVAL) -> None:
+        self.interval = interval
+        self.dirty = set()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def mark(self, journal) -> None:
+        """
+        Queues a journal to be synced with the next batch.
+        """
+        with self.lock:
+            self.dirty.add(journal)
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+
+    def sync(self, journal) -> None:
+        """
+        Syncs a journal now, before it is closed.
+        """
+        with self.lock:
+            self.dirty.discard(journal)
+        os.fsync(journal.fd)
+
+    def run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self.lock:
+                journals, self.dirty = self.dirty, set()
+            for journal in journals:
+                try:
+                    os.fsync(journal.fd)
+                except (OSError, TypeError):
+                    # Closed since it was queued
+                    pass
+
+
+syncer = Syncer()
+
+
+def journal_enabled() -> bool:
+    """
+    Returns whether YOLKARIS_JOURNAL asks for sessions to be journaled:
+    '1', 'true' or 'yes', in any case.
+    """
+    return os.environ.get("YOLKARIS_JOURNAL", "").strip().lower() in \
+        ("1", "true", "yes")
+
+
+def journal_path(token: str) -> str:
+    """
+    Returns the path of the journal of a session token.
+    """
+    return os.path.join(SESSIONS_DIR, f"{token}.journal")
+
+
+def lock(fd: int) -> bool:
+    """
+    Locks a journal for the session writing it. Returns False when another
+    session holds it.
+    """
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+class Journal:
+    """
+    Write-ahead log of a session: its seed and every answer the player
+    gave, in order. Games are driven by their seed and the answers alone,
+    so replaying the answers onto games seeded the same way rebuilds the
+    session exactly, random draws included.
+    - token: the session token naming the journal file
+    - seed: the seed of the session
+    - fd: the journal file, open for appending
+    - entries: the entries still to replay, as (kind, payload, start)
+      where start is the offset of the entry in the file
+    """
+
+    def __init__(self, token: str, seed: int, fd: int,
+                 entries=None) -> None:
+        self.token = token
+        self.seed = seed
+        self.fd = fd
+        self.entries = list(reversed(entries)) if entries else []
+        self.port = None
+        self.clock = None
+
+    @classmethod
+    def create(cls, seed: int):
+        """
+        Starts the journal of a new session.
+        """
+        os.makedirs(SESSIONS_DIR, exist_ok=True)
+        prune()
+        token = secrets.token_hex(6)
+        fd = os.open(journal_path(token),
+                     os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_APPEND,
+                     0o600)
+        lock(fd)
+        header = bytearray(MAGIC)
+        header.append(VERSION)
+        write_varint(header, seed)
+        os.write(fd, header)
+        return cls(token, seed, fd)
+
+    @classmethod
+    def open(cls, token: str):
+        """
+        Opens the journal of a session that ended without saving, to replay
+        it. Returns None if there is no such journal, it is damaged or its
+        session is still running.
+        """
+        if not TOKEN.fullmatch(token):
+            return None
+        try:
+            fd = os.open(journal_path(token), os.O_RDWR | os.O_APPEND)
+        except OSError:
+            return None
+        if not lock(fd):
+            os.close(fd)
+            return None
+        with os.fdopen(os.dup(fd), "rb") as file:
+            data = file.read()
+        try:
+            seed, entries, size = parse(data)
+        except SnapshotError:
+            os.close(fd)
+            return None
+        if size < len(data):
+            os.ftruncate(fd, size)
+        return cls(token, seed, fd, entries)
+
+    @property
+    def replaying(self) -> bool:
+        """
+        Whether entries are left to replay.
+        """
+        return bool(self.entries)
+
+    def append(self, kind: int, payload: bytes = b"") -> None:
+        entry = bytearray()
+        write_varint(entry, len(payload) << 2 | kind)
+        entry += payload
+        os.write(self.fd, entry)
+        syncer.mark(self)
+
+    def record(self, answer: str) -> None:
+        """
+        Appends an answer of the player.
+        """
+        self.append(ANSWER, answer.encode())
+
+    def record_skip(self) -> None:
+        """
+        Appends a 'continue' prompt skipped by answers typed ahead.
+        """
+        self.append(SKIP)
+
+    def record_snapshot(self, data: bytes) -> None:
+        """
+        Appends the saved game the session resumed, which is deleted once
+        resumed.
+        """
+        self.append(SNAPSHOT, data)
+
+    def replay(self, kind: int):
+        """
+        Returns the payload of the next entry if it is of the kind asked
+        for. Otherwise the game went another way than the journal, the
+        entries left are dropped and None is returned.
+        """
+        next_kind, payload, start = self.entries[-1]
+        if next_kind != kind:
+            # Forget what can't be replayed, so the journal stays in step
+            # with the session from here on
+            os.ftruncate(self.fd, start)
+            self.entries.clear()
+            self.resume_output()
+            return None
+        self.entries.pop()
+        if not self.entries:
+            self.resume_output()
+        return payload
+
+    def replay_answer(self):
+        """
+        Returns the next answer to replay, or None.
+        """
+        payload = self.replay(ANSWER)
+        return payload.decode() if payload is not None else None
+
+    def replay_skip(self) -> bool:
+        """
+        Returns whether the next 'continue' prompt was skipped.
+        """
+        if self.entries[-1][0] != SKIP:
+            return False
+        return self.replay(SKIP) is not None
+
+    def replay_snapshot(self):
+        """
+        Returns the saved game the session resumed, or None if it did not
+        resume one.
+        """
+        if self.entries[-1][0] != SNAPSHOT:
+            return None
+        return self.replay(SNAPSHOT)
+
+    def attach(self, port) -> None:
+        """
+        Journals the answers given through the port. A journal with
+        entries to replay holds back the output and the delays of the
+        port until they are replayed.
+        """
+        self.port = port
+        port.journal = self
+        write(TOKEN_SEQUENCE.format(self.token), flush=True, port=port)
+        if self.entries:
+            text("Recovering your session...", delay=0, space=1, port=port)
+            port.flush()
+            self.clock = port.clock
+            port.clock = InstantClock()
+            # Shadow the output methods of this port only, the class ones
+            # come back once the replay is over
+            port.write = port.flush = mute
+
+    def resume_output(self) -> None:
+        """
+        Gives the port its output and delays back once the replay is over.
+        """
+        port = self.port
+        if port is None or self.clock is None:
+            return
+        port.clock = self.clock
+        self.clock = None
+        del port.write, port.flush
+        # What the replay drew was never shown
+        port.page += 1
+
+    def close(self, remove: bool = False) -> None:
+        """
+        Syncs and closes the journal.
+        - remove: delete the journal, once the session ended for good or
+          was saved another way
+        """
+        if self.fd is None:
+            return
+        syncer.sync(self)
+        if self.port is not None and self.port.journal is self:
+            self.port.journal = None
+        if remove:
+            try:
+                os.unlink(journal_path(self.token))
+            except OSError:
+                pass
+        os.close(self.fd)
+        self.fd = None
+
+
+def mute(*_) -> None:
+    """
+    Drops the output of a session being replayed.
+    """
+
+
+def parse(data: bytes) -> tuple:
+    """
+    Returns the seed and the entries of a journal file, and the size of
+    the entries read. An entry cut short by a crash while it was written is
+    dropped.
+    """
+    reader = Reader(data)
+    if reader.take(len(MAGIC)) != MAGIC:
+        raise SnapshotError("not a journal")
+    if reader.take(1)[0] != VERSION:
+        raise SnapshotError("journal version is not supported")
+    seed = reader.varint()
+    entries = []
+    size = reader.offset
+    while reader.offset < len(data):
+        try:
+            header = reader.varint()
+            payload = reader.take(header >> 2)
+        except SnapshotError:
+            break
+        entries.append((header & 3, payload, size))
+        size = reader.offset
+    return seed, entries, size
+
+
+def recover(port, journal) -> int:
+    """
+    Replaces the journal of a session with the journal it recovers, and
+    returns the seed to replay it from.
+    """
+    if port.journal is not None:
+        port.journal.close(remove=True)
+    journal.attach(port)
+    return journal.seed
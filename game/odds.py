@@ -0,0 +1,167 @@
+from functools import lru_cache
+from itertools import product
+from math import ceil
+
+from .characters import PLAYER_HEALTH, PLAYER_ATTACK, PLAYER_DEFENSE
+
+# Health given back by the smallest potion, the unit potions are counted in.
+SMALL_POTION = 25
+
+# Odds tables of each fight, computed up to the healthiest enemy asked about.
+# Smaller enemy health reads from the same table. Computing a table takes
+# 40 to 140 ms, reading odds from it about 20 us, so hosts fill them with
+# warm_odds before their sessions start.
+tables = {}
+
+
+def ramp_integral(t: float, low: float, high: float) -> float:
+    """
+    Returns the integral up to t of the cumulative distribution of a uniform
+    draw between low and high.
+    """
+    if t <= low:
+        return 0.0
+    if t >= high:
+        return (high - low) / 2 + (t - high)
+    return (t - low) ** 2 / (2 * (high - low))
+
+
+def hit_cdf(x: float, attack: float, defense: float) -> float:
+    """
+    Returns the probability that uniform(0.5 * attack, attack) minus
+    uniform(0, defense) is at most x.
+    """
+    low, high = 0.5 * attack, attack
+    if defense <= 0:
+        if high <= low:
+            return 1.0 if x >= low else 0.0
+        return min(max((x - low) / (high - low), 0.0), 1.0)
+    if high <= low:
+        # The attack is a constant, only the defense is drawn
+        return min(max((x - low + defense) / defense, 0.0), 1.0)
+    return (ramp_integral(x + defense, low, high) -
+            ramp_integral(x, low, high)) / defense
+
+
+@lru_cache(maxsize=None)
+def damage_pmf(attack: float, defense: float) -> tuple:
+    """
+    Returns the exact distribution of the damage dealt by
+    Combat.calculate_damage, max(int(uniform(0.5 * attack, attack) -
+    uniform(0, defense)), 1), as (damage, probability) pairs.
+    """
+    # int() truncates towards zero, so anything below 2 deals 1 damage
+    pmf = [(1, hit_cdf(2, attack, defense))]
+    for damage in range(2, int(attack) + 1):
+        chance = hit_cdf(damage + 1, attack, defense) - \
+            hit_cdf(damage, attack, defense)
+        if chance > 0:
+            pmf.append((damage, chance))
+    return tuple(pmf)
+
+
+def odds_table(attack: int, defense: int, enemy_attack: int,
+               enemy_defense: int, enemy_health: int,
+               max_health: int = PLAYER_HEALTH,
+               potion_health: int = SMALL_POTION) -> tuple:
+    """
+    Returns the odds tables of a fight, covering at least the enemy health,
+    computing them the first time the fight is asked about.
+    """
+    key = (attack, defense, enemy_attack, enemy_defense, max_health,
+           potion_health)
+    table = tables.get(key)
+    if table is None or len(table[0][0]) <= enemy_health:
+        table = tables[key] = compute_odds(
+            attack, defense, enemy_attack, enemy_defense, enemy_health,
+            max_health, potion_health)
+    return table
+
+
+def compute_odds(attack: int, defense: int, enemy_attack: int,
+                 enemy_defense: int, enemy_health: int,
+                 max_health: int = PLAYER_HEALTH,
+                 potion_health: int = SMALL_POTION) -> tuple:
+    """
+    Computes the odds of a fight from every state it can be in, the way
+    Combat.combat plays it: the player hits first and fights until one of
+    them falls. Returns two tables indexed [player health][enemy health]:
+    the probability to win, and the potions needed to heal back to full
+    health after the fight, counted as 0 when the fight is lost.
+    """
+    hits = damage_pmf(attack, enemy_defense)
+    blows = damage_pmf(enemy_attack, defense)
+    rows, columns = max_health + 1, enemy_health + 1
+    win = [[0.0] * columns for _ in range(rows)]
+    potions = [[0.0] * columns for _ in range(rows)]
+    # Odds once the enemy struck back, before the player's next hit
+    struck_win = [[0.0] * columns for _ in range(rows)]
+    struck_potions = [[0.0] * columns for _ in range(rows)]
+
+    for enemy in range(1, columns):
+        for player in range(1, rows):
+            won = needed = 0.0
+            healing = ceil((max_health - player) / potion_health)
+            for damage, chance in hits:
+                if damage >= enemy:
+                    won += chance
+                    needed += chance * healing
+                else:
+                    won += chance * struck_win[player][enemy - damage]
+                    needed += chance * struck_potions[player][enemy - damage]
+            win[player][enemy] = won
+            potions[player][enemy] = needed
+
+            won = needed = 0.0
+            for damage, chance in blows:
+                if damage < player:
+                    won += chance * win[player - damage][enemy]
+                    needed += chance * potions[player - damage][enemy]
+            struck_win[player][enemy] = won
+            struck_potions[player][enemy] = needed
+    return win, potions
+
+
+def warm_odds(level: int) -> None:
+    """
+    Computes the odds tables of every enemy of the game level, for every
+    weapon and armour the player can have on, so no game computes them.
+    Hosts call it before forking, so their sessions share the tables.
+    """
+    # simulate loads the templates, whose areas import this module
+    from .simulate import content_catalogue
+
+    enemies, weapons, armours = content_catalogue(level)
+    for enemy, weapon, armour in product(enemies, [None] + weapons,
+                                         [None] + armours):
+        odds_table(PLAYER_ATTACK + (weapon.attack if weapon else 0),
+                   PLAYER_DEFENSE + (armour.defense if armour else 0),
+                   enemy.attack, enemy.defense, enemy.health)
+
+
+def fight_odds(player, enemy, potion_health: int = SMALL_POTION) -> dict:
+    """
+    Returns the exact odds of the player fighting the enemy to the end: the
+    probability to win and to lose, and the potions the player can expect
+    to need after a win.
+    - player: the player, with its weapon and armour
+    - enemy: the enemy, with its current health
+    - potion_health: the health given back by one potion
+    """
+    attack = player.attack + (player.weapon.attack if player.weapon else 0)
+    defense = player.defense + \
+        (player.armour.defense if player.armour else 0)
+    health = min(max(player.health, 0), PLAYER_HEALTH)
+    if enemy.health <= 0:
+        return {"win": 1.0, "lose": 0.0, "potions": 0.0}
+    if health <= 0:
+        return {"win": 0.0, "lose": 1.0, "potions": 0.0}
+
+    win, potions = odds_table(attack, defense, enemy.attack, enemy.defense,
+                              enemy.health, PLAYER_HEALTH, potion_health)
+    chance = win[health][enemy.health]
+    return {
+        "win": chance,
+        "lose": 1.0 - chance,
+        "potions": potions[health][enemy.health] / chance if chance else 0.0
+    }
@@ -0,0 +1,181 @@
+import argparse
+import sys
+import time
+from itertools import product
+
+from .bundle import STORYLINES
+from .characters import Enemy, PLAYER_HEALTH, PLAYER_ATTACK, PLAYER_DEFENSE
+from .items import Weapon, Armour
+from .world import template_areas, area_items
+
+
+def import_numpy():
+    """
+    Returns numpy, which is only needed to run the simulations and is not
+    installed with the game.
+    """
+    try:
+        import numpy
+    except ImportError:
+        sys.exit("The combat simulator needs numpy: "
+                 "pip install -r requirements-dev.txt")
+    return numpy
+
+
+def content_catalogue(level: int) -> tuple:
+    """
+    Returns the enemies, weapons and armours of the game level, each listed
+    once, from its areas and from the items its story lines give away.
+    """
+    enemies, weapons, armours = {}, {}, {}
+    for area in template_areas(level):
+        if isinstance(area.enemy, Enemy):
+            enemies.setdefault(area.enemy.name, area.enemy)
+        for item in area_items(area):
+            # Items named 'none' take the player's equipment away
+            if item is None or item.name == 'none':
+                continue
+            if isinstance(item, Weapon):
+                weapons.setdefault(item.name, item)
+            elif isinstance(item, Armour):
+                armours.setdefault(item.name, item)
+    return (list(enemies.values()), list(weapons.values()),
+            list(armours.values()))
+
+
+def simulate_fights(enemy, fights: int, weapon=None, armour=None,
+                    rng=None) -> dict:
+    """
+    Simulates fights between a new player and the enemy, all at once, the
+    way Combat.combat plays them: the player hits first and never retreats.
+    Damage uses the formula of Combat.calculate_damage. Returns the win
+    probability, the expected number of turns and the health the player
+    has left at the end of the fights won.
+    - enemy: the enemy fought
+    - fights: the number of fights to simulate
+    - weapon: the weapon the player has equipped
+    - armour: the armour the player has equipped
+    - rng: the numpy random generator drawing the damage
+    """
+    np = import_numpy()
+    rng = rng if rng is not None else np.random.default_rng()
+    attack = PLAYER_ATTACK + (weapon.attack if weapon else 0)
+    defense = PLAYER_DEFENSE + (armour.defense if armour else 0)
+
+    player_health = np.full(fights, PLAYER_HEALTH, dtype=np.int64)
+    enemy_health = np.full(fights, enemy.health, dtype=np.int64)
+    turns = np.zeros(fights, dtype=np.int64)
+    fighting = np.arange(fights)
+
+    while fighting.size:
+        turns[fighting] += 1
+        hits = damage(np, rng, attack, enemy.defense, fighting.size)
+        enemy_health[fighting] -= hits
+        fighting = fighting[enemy_health[fighting] > 0]
+
+        hits = damage(np, rng, enemy.attack, defense, fighting.size)
+        player_health[fighting] -= hits
+        fighting = fighting[player_health[fighting] > 0]
+
+    won = enemy_health <= 0
+    health_left = player_health[won]
+    return {
+        "enemy": enemy.name,
+        "weapon": weapon.name if weapon else None,
+        "armour": armour.name if armour else None,
+        "fights": fights,
+        "win_probability": float(won.mean()),
+        "expected_turns": float(turns.mean()),
+        "health_left": {
+            percentile: int(np.percentile(health_left, percentile))
+            for percentile in (10, 50, 90)
+        } if health_left.size else {},
+        "health_histogram": np.bincount(
+            health_left, minlength=PLAYER_HEALTH + 1) if health_left.size
+        else np.zeros(PLAYER_HEALTH + 1, dtype=np.int64)
+    }
+
+
+def damage(np, rng, attack, defense, size):
+    """
+    Draws the damage of size hits at once, like Combat.calculate_damage:
+    max(int(uniform(0.5 * attack, attack) - uniform(0, defense)), 1).
+    """
+    hits = rng.uniform(0.5 * attack, attack, size) - \
+        rng.uniform(0, defense, size)
+    return np.maximum(np.trunc(hits).astype(np.int64), 1)
+
+
+def simulate_level(level: int, fights: int, seed=None) -> list:
+    """
+    Simulates the fights against every enemy of the game level, for every
+    weapon and armour loadout found in its content. Returns one result per
+    enemy and loadout.
+    """
+    np = import_numpy()
+    rng = np.random.default_rng(seed)
+    enemies, weapons, armours = content_catalogue(level)
+    loadouts = list(product([None] + weapons, [None] + armours))
+    return [
+        simulate_fights(enemy, fights, weapon, armour, rng)
+        for enemy in enemies
+        for weapon, armour in loadouts
+    ]
+
+
+def print_results(level: int, results: list) -> None:
+    """
+    Prints the results of a level, one line per enemy and loadout.
+    """
+    print(f"Level {level}:")
+    width = max((len(result["enemy"]) for result in results), default=0)
+    for result in results:
+        loadout = f"{result['weapon'] or 'no weapon'}, " \
+                  f"{result['armour'] or 'no armour'}"
+        health = result["health_left"]
+        health_left = "/".join(str(health[p]) for p in (10, 50, 90)) \
+            if health else "-"
+        print(f"  {result['enemy']:<{width}}  {loadout:<42}"
+              f"win {result['win_probability']:6.1%}  "
+              f"turns {result['expected_turns']:5.2f}  "
+              f"health p10/50/90 {health_left}")
+
+
+def weakest_odds(results: list) -> dict:
+    """
+    Returns, for each enemy, the best win probability over all loadouts.
+    """
+    odds = {}
+    for result in results:
+        odds[result["enemy"]] = max(odds.get(result["enemy"], 0.0),
+                                    result["win_probability"])
+    return odds
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Simulate the fights of Yolkaris Odyssey.")
+    parser.add_argument("--fights", type=int, default=1000000,
+                        help="fights per enemy and loadout")
+    parser.add_argument("--level", type=int, nargs="+",
+                        default=list(STORYLINES))
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--min-win", type=float, default=None,
+                        help="fail if an enemy can't be beaten with this "
+                             "probability with any loadout")
+    args = parser.parse_args()
+
+    failed = False
+    for game_level in args.level:
+        started = time.perf_counter()
+        level_results = simulate_level(game_level, args.fights, args.seed)
+        print_results(game_level, level_results)
+        print(f"  {len(level_results) * args.fights} fights in "
+              f"{time.perf_counter() - started:.2f}s")
+        if args.min_win is not None:
+            for name, chance in weakest_odds(level_results).items():
+                if chance < args.min_win:
+                    print(f"  {name} is beaten at most {chance:.1%} of the "
+                          f"time")
+                    failed = True
+    sys.exit(1 if failed else 0)
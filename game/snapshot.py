@@ -0,0 +1,235 @@
+import zlib
+from functools import lru_cache
+
+from .bundle import STORYLINES
+from .characters import Player
+from .world import EnemyState, template_areas, area_items
+
+# First bytes of every snapshot, followed by the format version.
+MAGIC = b"YO"
+VERSION = 2
+
+
+class SnapshotError(ValueError):
+    """
+    Raised when a snapshot can't be read: it is damaged, of another format
+    version or of content that changed since it was taken.
+    """
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    """
+    Appends an unsigned integer, 7 bits per byte.
+    """
+    while value > 0x7f:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def write_signed(out: bytearray, value: int) -> None:
+    """
+    Appends a signed integer, zigzag encoded so small negatives stay small.
+    """
+    write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+
+
+class Reader:
+    """
+    Reads the values of a snapshot in the order they were written.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.offset = 0
+
+    def varint(self) -> int:
+        value = shift = 0
+        while True:
+            try:
+                byte = self.data[self.offset]
+            except IndexError:
+                raise SnapshotError("snapshot is truncated") from None
+            self.offset += 1
+            value |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def signed(self) -> int:
+        value = self.varint()
+        return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+    def take(self, size: int) -> bytes:
+        if self.offset + size > len(self.data):
+            raise SnapshotError("snapshot is truncated")
+        chunk = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return chunk
+
+
+@lru_cache(maxsize=None)
+def content_items(level: int) -> tuple:
+    """
+    Returns every item of the game level in a stable order: the order they
+    appear in its content. An item's index in this list is its ID.
+    """
+    items, seen = [], set()
+    for area in template_areas(level):
+        for item in area_items(area):
+            if item is not None and id(item) not in seen:
+                seen.add(id(item))
+                items.append(item)
+    return tuple(items)
+
+
+@lru_cache(maxsize=None)
+def item_ids(level: int) -> dict:
+    """
+    Returns the ID of each item of the game level, keyed by the item's id().
+    """
+    return {id(item): index
+            for index, item in enumerate(content_items(level))}
+
+
+@lru_cache(maxsize=None)
+def fingerprint(level: int) -> int:
+    """
+    Returns a checksum of the names of the areas and items of the game
+    level, so snapshots are not restored onto different content.
+    """
+    names = [area.name for area in template_areas(level)] + \
+        [item.name for item in content_items(level)]
+    return zlib.crc32("\n".join(names).encode())
+
+
+def write_item_ids(out: bytearray, items, ids: dict) -> None:
+    """
+    Appends a list of items by ID.
+    """
+    write_varint(out, len(items))
+    for item in items:
+        write_varint(out, ids[id(item)])
+
+
+def read_items(reader: Reader, items: tuple) -> list:
+    """
+    Reads a list of items written by write_item_ids.
+    """
+    try:
+        return [items[reader.varint()] for _ in range(reader.varint())]
+    except IndexError:
+        raise SnapshotError("unknown item in snapshot") from None
+
+
+def save(game) -> bytes:
+    """
+    Returns a compact snapshot of the game being played: the player, where
+    they are, what they saw and everything the game changed in the
+    content. Content is referenced by ID, so a snapshot is a couple of
+    hundred bytes at most.
+    """
+    ids = item_ids(game.level)
+    player = game.player
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    write_varint(out, game.level)
+    write_varint(out, fingerprint(game.level))
+    write_varint(out, game.seed)
+
+    name = player.name.encode()
+    write_varint(out, len(name))
+    out += name
+    for value in (player.health, player.attack, player.defense):
+        write_signed(out, value)
+    for item in (player.weapon, player.armour):
+        write_varint(out, ids[id(item)] + 1 if item else 0)
+    write_item_ids(out, player.potions, ids)
+    write_item_ids(out, player.inventory, ids)
+    write_varint(out, game.steps)
+    write_varint(out, int(game.play_time()))
+
+    write_varint(out, game.current_location)
+    write_varint(out, len(game.location_objects))
+    for location in game.location_objects.values():
+        for x, y in (location.player_position,
+                     location.player_prev_position):
+            write_varint(out, x)
+            write_varint(out, y)
+
+        # The visited bitset is stored as it is kept, a bit per cell
+        out += location.visited
+
+        positions = {id(area): position
+                     for position, area in location.contents.items()}
+        for area in location.areas:
+            x, y = positions[id(area)]
+            write_varint(out, x)
+            write_varint(out, y)
+            # Only what this game changed is saved
+            changed = area.changes()
+            out.append(("items" in changed) | ("enemy" in changed) << 1)
+            if "items" in changed:
+                write_item_ids(out, changed["items"], ids)
+            if "enemy" in changed:
+                write_signed(out, area.enemy.health)
+                out.append(int(bool(area.enemy.fought)))
+    return bytes(out)
+
+
+def restore(game, data: bytes) -> None:
+    """
+    Restores a snapshot taken by save into a new game, which must not have
+    been set up yet. Raises SnapshotError if the snapshot can't be used.
+    """
+    reader = Reader(data)
+    if reader.take(len(MAGIC)) != MAGIC:
+        raise SnapshotError("not a snapshot")
+    version = reader.take(1)[0]
+    if version != VERSION:
+        raise SnapshotError(f"snapshot version {version} is not supported")
+    level = reader.varint()
+    if level not in STORYLINES:
+        raise SnapshotError(f"unknown game level {level}")
+    if reader.varint() != fingerprint(level):
+        raise SnapshotError("the game content changed since the snapshot")
+    items = content_items(level)
+    game.seed = reader.varint()
+    game.rng.seed(game.seed)
+
+    name = reader.take(reader.varint()).decode()
+    health, attack, defense = (reader.signed() for _ in range(3))
+    weapon, armour = (reader.varint() for _ in range(2))
+    player = Player(name=name, health=health, attack=attack,
+                    defense=defense, potions=read_items(reader, items),
+                    inventory=read_items(reader, items))
+    try:
+        player.weapon = items[weapon - 1] if weapon else None
+        player.armour = items[armour - 1] if armour else None
+    except IndexError:
+        raise SnapshotError("unknown item in snapshot") from None
+    game.player = player
+    game.steps = reader.varint()
+    game.played = float(reader.varint())
+
+    game.setup_areas(level)
+    game.current_location = reader.varint()
+    if reader.varint() != len(game.location_objects):
+        raise SnapshotError("snapshot does not match the game level")
+    for location in game.location_objects.values():
+        location.player_position = (reader.varint(), reader.varint())
+        location.player_prev_position = (reader.varint(), reader.varint())
+
+        location.visited = bytearray(reader.take(len(location.visited)))
+
+        location.contents.clear()
+        for area in location.areas:
+            location.contents[(reader.varint(), reader.varint())] = area
+            flags = reader.take(1)[0]
+            if flags & 1:
+                area.items = read_items(reader, items)
+            if flags & 2:
+                area.enemy = EnemyState(area.template.enemy)
+                area.enemy.health = reader.signed()
+                area.enemy.fought = bool(reader.take(1)[0])
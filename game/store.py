@@ -0,0 +1,273 @@
+import argparse
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from .bundle import STORYLINES
+from .hibernate import SESSIONS_DIR
+
+# Database of the finished runs and saved sessions.
+DEFAULT_PATH = os.environ.get(
+    "YOLKARIS_DB", os.path.join(SESSIONS_DIR, "yolkaris.sqlite3"))
+
+# Connections kept open for the queries of the sessions.
+POOL_SIZE = 4
+
+# Rows written in one transaction at most.
+BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    health INTEGER NOT NULL,
+    enemies_defeated INTEGER NOT NULL,
+    steps INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    seed INTEGER NOT NULL,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_top
+    ON runs (level, outcome, seconds, steps);
+CREATE TABLE IF NOT EXISTS sessions (
+    token TEXT PRIMARY KEY,
+    player TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    health INTEGER NOT NULL,
+    steps INTEGER NOT NULL,
+    saved_at REAL NOT NULL
+);
+"""
+
+INSERT_RUN = """
+INSERT INTO runs (player, level, outcome, health, enemies_defeated, steps,
+                  seconds, seed, finished_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_SESSION = """
+INSERT OR REPLACE INTO sessions (token, player, level, health, steps,
+                                 saved_at)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+TOP_RUNS = """
+SELECT player, health, enemies_defeated, steps, seconds, finished_at
+FROM runs
+WHERE level = ? AND outcome = 'won'
+ORDER BY seconds, steps
+LIMIT ?
+"""
+
+# Stops the writer thread.
+STOP = object()
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """
+    Opens a connection to the database in WAL mode, so sessions read the
+    leaderboard while runs are written.
+    """
+    connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class ConnectionPool:
+    """
+    Connections to the database shared by the sessions of a process, opened
+    the first time they are needed.
+    - path: the path of the database
+    - size: the number of connections kept open
+    """
+
+    def __init__(self, path: str, size: int = POOL_SIZE) -> None:
+        self.path = path
+        self.idle = queue.LifoQueue(maxsize=size)
+        self.opened = 0
+        self.size = size
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        """
+        Lends a connection, waiting for one to be given back when all of
+        them are in use.
+        """
+        try:
+            connection = self.idle.get_nowait()
+        except queue.Empty:
+            with self.lock:
+                spare = self.opened < self.size
+                self.opened += spare
+            connection = connect(self.path) if spare else self.idle.get()
+        try:
+            yield connection
+        finally:
+            self.idle.put(connection)
+
+    def close(self) -> None:
+        """
+        Closes the connections not in use.
+        """
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class Store:
+    """
+    Records the runs players finished and the sessions they saved, and
+    answers the leaderboard queries. Records are queued and written in
+    batches by a background thread, so games never wait for the disk.
+    - path: the path of the database (defaults to YOLKARIS_DB)
+    """
+
+    def __init__(self, path: str = None) -> None:
+        self.path = path or DEFAULT_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = connect(self.path)
+        connection.executescript(SCHEMA)
+        connection.close()
+        self.pool = ConnectionPool(self.path)
+        self.pending = queue.Queue()
+        self.writer = None
+        self.lock = threading.Lock()
+
+    def queue_write(self, statement: str, row: tuple) -> None:
+        """
+        Queues a row to be written with the next batch.
+        """
+        self.pending.put((statement, row))
+        with self.lock:
+            if self.writer is None or not self.writer.is_alive():
+                self.writer = threading.Thread(target=self.write_batches,
+                                               daemon=True)
+                self.writer.start()
+
+    def write_batches(self) -> None:
+        """
+        Writes the queued rows, everything queued meanwhile in one
+        transaction, until the store is closed.
+        """
+        with self.pool.connection() as connection:
+            while True:
+                batch = [self.pending.get()]
+                while len(batch) < BATCH_SIZE:
+                    try:
+                        batch.append(self.pending.get_nowait())
+                    except queue.Empty:
+                        break
+                rows = [write for write in batch if write is not STOP]
+                try:
+                    with connection:
+                        for statement, row in rows:
+                            connection.execute(statement, row)
+                except sqlite3.Error as error:
+                    # Drop the batch rather than the writer, so the games
+                    # and flush never wait on rows that can't be written
+                    print(f"Leaderboard: {len(rows)} rows not recorded: "
+                          f"{error}", file=sys.stderr)
+                finally:
+                    for _ in batch:
+                        self.pending.task_done()
+                if len(rows) < len(batch):
+                    return
+
+    def record_run(self, game) -> None:
+        """
+        Records a game whose story reached its end.
+        """
+        player = game.player
+        self.queue_write(INSERT_RUN, (
+            player.name, game.level,
+            "won" if player.health > 0 else "lost",
+            max(player.health, 0), game.enemies_defeated(), game.steps,
+            round(game.play_time(), 1), game.seed, time.time()
+        ))
+
+    def record_session(self, game) -> None:
+        """
+        Records a game saved for its idle player, by its session token.
+        """
+        self.queue_write(INSERT_SESSION, (
+            game.token, game.player.name, game.level, game.player.health,
+            game.steps, time.time()
+        ))
+
+    def top_runs(self, level: int, limit: int = 10) -> list:
+        """
+        Returns the fastest wins of the game level, fewest steps first on a
+        tie, found through the runs_top index.
+        """
+        with self.pool.connection() as connection:
+            # Set on a cursor, so the pooled connection is lent unchanged
+            cursor = connection.cursor()
+            cursor.row_factory = sqlite3.Row
+            return [dict(row) for row in
+                    cursor.execute(TOP_RUNS, (level, limit))]
+
+    def flush(self) -> None:
+        """
+        Waits until every queued row is written.
+        """
+        self.pending.join()
+
+    def close(self) -> None:
+        """
+        Writes the queued rows and closes the database.
+        """
+        if self.writer is not None and self.writer.is_alive():
+            self.pending.put(STOP)
+            self.writer.join()
+        self.pool.close()
+
+    def install(self, manager, close: bool = True) -> None:
+        """
+        Records the runs finished and the sessions saved in the games of a
+        game manager.
+        - close: close the store when the session ends, unless other
+          sessions still use it
+        """
+        manager.add_hook("finish", self.record_run)
+        manager.add_hook("save", self.record_session)
+        if close:
+            manager.add_hook("end", lambda game: self.close())
+
+
+def print_leaderboard(store: Store, level: int, limit: int) -> None:
+    """
+    Prints the fastest wins of a game level.
+    """
+    print(f"Level {level}:")
+    for rank, run in enumerate(store.top_runs(level, limit), start=1):
+        minutes, seconds = divmod(int(run["seconds"]), 60)
+        print(f"  {rank:>3}. {run['player']:<24} {minutes:>3}m{seconds:02}s "
+              f"{run['steps']:>5} steps  {run['enemies_defeated']} enemies "
+              f"defeated  {run['health']} health left")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Show the leaderboard of Yolkaris Odyssey.")
+    parser.add_argument("--db", default=None, help="path of the database")
+    parser.add_argument("--level", type=int, nargs="+",
+                        default=list(STORYLINES))
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    leaderboard = Store(args.db)
+    for game_level in args.level:
+        print_leaderboard(leaderboard, game_level, args.limit)
+    leaderboard.close()
@@ -0,0 +1,144 @@
+from functools import lru_cache
+from .bundle import load_storyline
+from .characters import Enemy
+from .locations import Area
+
+
+@lru_cache(maxsize=None)
+def load_template(level: int) -> dict:
+    """
+    Returns the world template of the game level, loaded once per process
+    and shared by every game. Templates are never changed: games work on
+    overlays created by new_world.
+    """
+    return load_storyline(level)
+
+
+def template_areas(level: int):
+    """
+    Yields the areas of the game level's template, location by location.
+    """
+    for key, areas in load_template(level).items():
+        if key.endswith("_areas"):
+            yield from areas
+
+
+def story_items(story_line):
+    """
+    Yields the items a story line gives away.
+    """
+    for line in story_line or []:
+        if 'item' in line:
+            yield line['item']
+
+
+def area_items(area):
+    """
+    Yields the items of an area in the order they appear in its content:
+    those lying in it, those the story lines of the area and of its
+    characters give away, then the item its neutral character asks for.
+    An item can be yielded more than once, and None when a story line
+    hands out nothing.
+    """
+    yield from area.items
+    for character in (area, area.enemy, area.neutral):
+        for name in getattr(character, "__slots__", ()):
+            if name.startswith("story_line"):
+                yield from story_items(getattr(character, name))
+    if area.neutral is not None:
+        yield area.neutral.quest_item
+
+
+class EnemyState(Enemy):
+    """
+    Per game overlay of a template enemy. Reads fall through to the
+    template; health and fought are stored on the overlay when they change.
+    """
+
+    __slots__ = ("template",)
+
+    def __init__(self, template: Enemy) -> None:
+        self.template = template
+
+    def __getattr__(self, name):
+        if name == "template":
+            raise AttributeError(name)
+        return getattr(self.template, name)
+
+    def changes(self) -> dict:
+        """
+        Returns the attributes changed by this game.
+        """
+        changed = {}
+        for name in Enemy.__slots__:
+            try:
+                changed[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return changed
+
+
+class AreaState(Area):
+    """
+    Per game overlay of a template area. Its item list is copied the first
+    time it is used and its enemy gets an overlay of its own; everything
+    else is read from the template.
+    """
+
+    __slots__ = ("template", "_items", "_enemy")
+
+    def __init__(self, template: Area) -> None:
+        self.template = template
+        self._items = None
+        self._enemy = None
+
+    def __getattr__(self, name):
+        if name == "template":
+            raise AttributeError(name)
+        return getattr(self.template, name)
+
+    @property
+    def items(self) -> list:
+        if self._items is None:
+            self._items = list(self.template.items)
+        return self._items
+
+    @items.setter
+    def items(self, items) -> None:
+        self._items = items
+
+    @property
+    def enemy(self):
+        if self._enemy is None and self.template.enemy:
+            self._enemy = EnemyState(self.template.enemy)
+        return self._enemy
+
+    @enemy.setter
+    def enemy(self, enemy) -> None:
+        self._enemy = enemy
+
+    def changes(self) -> dict:
+        """
+        Returns what this game changed in the area: its items once they were
+        copied, and the changed attributes of its enemy.
+        """
+        changed = {}
+        if self._items is not None:
+            changed["items"] = self._items
+        if self._enemy is not None and self._enemy.changes():
+            changed["enemy"] = self._enemy.changes()
+        return changed
+
+
+def new_world(level: int) -> dict:
+    """
+    Returns the content of the game level for a new game: the shared
+    template with an overlay on each area. Creating it copies no content,
+    so new games and restarts stay cheap however big the storyline is.
+    """
+    template = load_template(level)
+    return {
+        key: [AreaState(area) for area in value]
+        if key.endswith("_areas") else value
+        for key, value in template.items()
+    }
@@ -1,47 +1,63 @@
-from art import text2art
+import argparse
+import os
+import random
+import time
 from utils import (text, paragraph, add_space, clear_terminal, ask_user,
-                   loading, color_error)
+                   loading, color_error, get_port, TerminalPort, make_clock)
 from game.game_manager import game_manager
-from game.characters import Player
-from game.locations import (Location, Yolkaris, Mystara, Luminara,
-                            game_one, game_two)
+from game.commands import commands
+from game.characters import (Player, PLAYER_HEALTH, PLAYER_ATTACK,
+                             PLAYER_DEFENSE)
+from game.locations import Location, Yolkaris, Mystara, Luminara
+from game.world import new_world
+from game.bundle import load_banner
 from game.items import Book, Spaceship, Special
 from game.interactions import Interaction
+from game.store import Store
+from game.journal import journal_enabled
+from game import hibernate, snapshot
 
 
-def game_intro() -> None:
+def game_intro(port=None) -> None:
     """
     Displays the game intro.
     """
-    yolkaris = text2art("Yolkaris", font="dos_rebel", chr_ignore=True)
-    odyssey = text2art("Odyssey", font="dos_rebel", chr_ignore=True)
-    clear_terminal()
-    text(yolkaris)
-    text(odyssey)
+    yolkaris, odyssey = load_banner()
+    clear_terminal(port=port)
+    text(yolkaris, port=port)
+    text(odyssey, port=port)
     text("Welcome to Yolkaris Odyssey, a text-base"
-         " adventure game.", delay=0.1)
-    text("Coded and designed by Patrick Hladun. (v.1.0.4)", delay=0.1, space=1)
+         " adventure game.", delay=0.1, port=port)
+    text("Coded and designed by Patrick Hladun. (v.1.0.4)", delay=0.1, space=1,
+         port=port)
 
 
-def show_help() -> None:
+def show_help(port=None) -> None:
     """
     Displays the available commands.
     """
-    text("Available Commands:", space=1)
+    text("Available Commands:", space=1, port=port)
 
-    text("  north      - Move North (up)", delay=0.1)
-    text("  south      - Move South (down)", delay=0.1)
-    text("  east       - Move East (right)", delay=0.1)
-    text("  west       - Move West (left)", delay=0.1, space=1)
+    text("  north      - Move North (up)", delay=0.1, port=port)
+    text("  south      - Move South (down)", delay=0.1, port=port)
+    text("  east       - Move East (right)", delay=0.1, port=port)
+    text("  west       - Move West (left)", delay=0.1, space=1, port=port)
 
-    text("  map        - Show the map", delay=0.1)
-    text("  search     - Search the area for items", delay=0.1)
-    text("  help       - Show available commands", delay=0.1)
-    text("  inventory  - Show inventory", delay=0.1)
-    text("  potion     - Use a potion", delay=0.1)
-    text("  stats      - Show player stats", delay=0.1)
-    text("  restart    - Restart the game", delay=0.1)
-    text(" ")
+    text("  map        - Show the map", delay=0.1, port=port)
+    text("  search     - Search the area for items", delay=0.1, port=port)
+    text("  help       - Show available commands", delay=0.1, port=port)
+    text("  inventory  - Show inventory", delay=0.1, port=port)
+    text("  potion     - Use a potion", delay=0.1, port=port)
+    text("  stats      - Show player stats", delay=0.1, port=port)
+    text("  restart    - Restart the game", delay=0.1, space=1, port=port)
+
+    text("Commands can be shortened (n, e, st) and several can be entered "
+         "at once", delay=0.1, port=port)
+    text("with ';' between them (n;n;e;search).", delay=0.1, port=port)
+    text(" ", port=port)
+
+
+commands.register("help", lambda game: show_help(port=game.port))
 
 
 def reset_game(game_instance=None):
@@ -55,25 +71,32 @@ def reset_game(game_instance=None):
     return game_instance
 
 
-def select_game_level():
+def show_game_levels(port=None):
+    """
+    Lists the game levels the player can choose from.
+    """
+    text("Select your Game:", delay=0.2, space=1, port=port)
+    text("   1. The Broken Clock", delay=0.2, port=port)
+    text("   2. The Dark Dust", delay=0.2, space=1, port=port)
+
+
+def select_game_level(port=None):
     """
     This method allows the player to select the game level.
     """
-    text("Select your Game:", delay=0.2, space=1)
-    text("   1. The Broken Clock", delay=0.2)
-    text("   2. The Dark Dust", delay=0.2, space=1)
-    return ask_user(prompt_type="game", numbers=['1', '2'])
+    show_game_levels(port=port)
+    return ask_user(prompt_type="game", numbers=['1', '2'], port=port)
 
 
-def inspect_inventory_item(item):
+def inspect_inventory_item(item, port=None):
     """
     Inspects an item in the player's inventory.
     """
     name = item.name
     description = item.description
-    add_space()
-    paragraph(f"{name}", space=1)
-    paragraph(f"{description}", space=1)
+    add_space(port=port)
+    paragraph(f"{name}", space=1, port=port)
+    paragraph(f"{description}", space=1, port=port)
 
 
 class Game:
@@ -81,29 +104,69 @@ class Game:
     This is the main class for the game.
     """
 
-    def __init__(self) -> None:
+    # Classes used to build each location of the game world.
+    location_classes = {
+        "Yolkaris": Yolkaris,
+        "Mystara": Mystara,
+        "Luminara": Luminara
+    }
+
+    def __init__(self, port=None, seed=None) -> None:
         """
         Initializes the game.
-        """
-        self.interaction = Interaction(self)
+        - port: the port the game is played through (defaults to the
+          terminal)
+        - seed: the seed of the game's random choices, the same seed
+          replaying the same game (defaults to a random one)
+        """
+        self.port = port
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.rng = random.Random(self.seed)
+        self.interaction = Interaction(self, port=self.port, rng=self.rng)
         self.location_objects = {}
         self.current_location = 0
         self.game_over = False
         self.player = None
+        self.level = None
+        self.resumed = False
+        self.token = None
+        # The game as it was at the last main prompt, saved for the player
+        # when they go idle
+        self.checkpoint = None
+        # Progress shown on the leaderboard: the moves made, and the time
+        # played before the game was last resumed plus since then
+        self.steps = 0
+        self.played = 0.0
+        self.started = time.monotonic()
 
     def setup_game(self):
         """
         This method sets up the game.
         """
-        game_intro()
+        game_intro(port=self.port)
         self.create_player()
-        clear_terminal()
-        text(f"Hey {self.player.name}!", delay=0.6, space=1)
+        if self.resumed:
+            self.welcome_back()
+            return
+        self.welcome_player()
+        game_level = select_game_level(port=self.port)
+        self.setup_areas(game_level)
+        self.generate_world()
+        starting_location = self.get_current_location()
+        starting_location.check_for_interaction((0, 0), self.player)
+        self.display_map()
+
+    def welcome_player(self) -> None:
+        """
+        Welcomes the player and introduces the two adventures.
+        """
+        clear_terminal(port=self.port)
+        text(f"Hey {self.player.name}!", delay=0.6, space=1, port=self.port)
         paragraph("Welcome to Yolkaris Odyssey! You're about to embark on a"
                   " thrilling adventure as Charlie, a courageous chicken with "
                   "a spirit of exploration. This game takes you to the"
                   " beautiful planet of Yolkaris, where every corner is filled"
-                  " with wonder and mystery.", space=1)
+                  " with wonder and mystery.", space=1, port=self.port)
         paragraph("Yolkaris Odyssey offers two distinct adventures. The first"
                   " is a concise journey focusing on a single planet, ideal"
                   " for those seeking a swift and engaging experience. The"
@@ -112,56 +175,112 @@ class Game:
                   " challenges and secrets to uncover. Your mission in both"
                   " adventures is to save Yolkaris from imminent threats,"
                   " navigating through dangers and unraveling mysteries to"
-                  " ensure the survival of your world.")
-        game_level = select_game_level()
-        self.setup_areas(game_level)
-        clear_terminal()
+                  " ensure the survival of your world.", port=self.port)
+
+    def welcome_back(self) -> None:
+        """
+        Welcomes back the player of a resumed game, where they left it.
+        """
+        clear_terminal(port=self.port)
+        text(f"Welcome back {self.player.name}!", delay=0.6, space=1,
+             port=self.port)
+        self.started = time.monotonic()
+        self.display_map()
+
+    def generate_world(self) -> None:
+        """
+        Shows the loading screen and puts the player in the first location.
+        """
+        clear_terminal(port=self.port)
         loading(['Generating game', '.', '.', '.', '.', '.',
-                 '.', '.'], 'Game generated')
-        loading(['Starting game', '.', '.', '.', '.'])
+                 '.', '.'], 'Game generated', port=self.port)
+        loading(['Starting game', '.', '.', '.', '.'], port=self.port)
         self.assign_player_to_location()
         self.current_location = 0
-        starting_location = self.get_current_location()
-        starting_location.check_for_interaction((0, 0), self.player)
-        self.display_map()
+        self.started = time.monotonic()
+
+    def play_time(self) -> float:
+        """
+        Returns the seconds the game has been played since its world was
+        generated, over all its sessions.
+        """
+        return self.played + time.monotonic() - self.started
+
+    def enemies_defeated(self) -> int:
+        """
+        Returns the number of enemies the player defeated.
+        """
+        return sum(1 for location in self.location_objects.values()
+                   for area in location.areas
+                   if area.enemy and area.enemy.health <= 0)
 
     def start_game(self) -> None:
         """
         This is the main game loop.
         """
         while not self.game_over:
+            self.save_checkpoint()
             self.choose_action()
 
+    def save_checkpoint(self) -> None:
+        """
+        Snapshots the game at the main prompt, when the player's port saves
+        the games of idle players. Going idle partway through an
+        interaction saves this snapshot instead, so the interaction plays
+        again in full on resume rather than being skipped as visited.
+        """
+        if get_port(self.port).idle_timeout:
+            self.checkpoint = snapshot.save(self)
+
+    def load_content(self, level) -> dict:
+        """
+        Returns the content of the selected game level, as an overlay on the
+        shared world template so this game's changes stay its own.
+        """
+        return new_world(level)
+
     def setup_areas(self, level) -> None:
         """
         Sets up the areas in the game.
         """
+        content = self.load_content(level)
+        locations = self.location_classes
+        self.level = level
+
         if level == 1:
 
             self.location_objects = {
-                "Yolkaris": Yolkaris(
-                    game_one["yolkaris_size"],
-                    game_one["yolkaris_areas"],
+                "Yolkaris": locations["Yolkaris"](
+                    content["yolkaris_size"],
+                    content["yolkaris_areas"],
+                    port=self.port,
+                    rng=self.rng
                 )
             }
 
         elif level == 2:
 
             self.location_objects = {
-                "Yolkaris": Yolkaris(
-                    game_two["yolkaris_size"],
-                    game_two["yolkaris_areas"],
-                    game_two["yolkaris_travel"]
+                "Yolkaris": locations["Yolkaris"](
+                    content["yolkaris_size"],
+                    content["yolkaris_areas"],
+                    content["yolkaris_travel"],
+                    port=self.port,
+                    rng=self.rng
                 ),
-                "Mystara": Mystara(
-                    game_two["mystara_size"],
-                    game_two["mystara_areas"],
-                    game_two["mystara_travel"]
+                "Mystara": locations["Mystara"](
+                    content["mystara_size"],
+                    content["mystara_areas"],
+                    content["mystara_travel"],
+                    port=self.port,
+                    rng=self.rng
                 ),
-                "Luminara": Luminara(
-                    game_two["luminara_size"],
-                    game_two["luminara_areas"],
-                    game_two["luminara_travel"]
+                "Luminara": locations["Luminara"](
+                    content["luminara_size"],
+                    content["luminara_areas"],
+                    content["luminara_travel"],
+                    port=self.port,
+                    rng=self.rng
                 )
             }
 
@@ -172,24 +291,37 @@ class Game:
         while True:
             username = ask_user(
                 prompt_type=None, prompt="Please enter the username to start "
-                                         "your adventure: ")
-            if 3 <= len(username) <= 24 and username.isalnum() and "_" \
-                    not in username:
-                self.player = Player(
-                    name=username,
-                    health=100,
-                    attack=15,
-                    defense=10,
-                    potions=[],
-                    inventory=[]
-                )
+                                         "your adventure: ", port=self.port)
+            if self.new_player(username):
                 break
-            else:
-                paragraph("Invalid username. It should be between 3 to 24 "
-                          "characters ,contain only letters and numbers, and "
-                          "no underscores.",
-                          color=color_error,
-                          )
+
+    def new_player(self, username) -> bool:
+        """
+        Creates the player if the username is valid, otherwise shows why it
+        is not. Returns whether the player was created. 'resume <token>'
+        resumes the game saved when the player went idle instead.
+        """
+        token = hibernate.resume_token(username)
+        if token is not None:
+            self.resumed = hibernate.resume(self, token)
+            return self.resumed
+        if 3 <= len(username) <= 24 and username.isalnum() and "_" \
+                not in username:
+            self.player = Player(
+                name=username,
+                health=PLAYER_HEALTH,
+                attack=PLAYER_ATTACK,
+                defense=PLAYER_DEFENSE,
+                potions=[],
+                inventory=[]
+            )
+            return True
+        paragraph("Invalid username. It should be between 3 to 24 "
+                  "characters ,contain only letters and numbers, and "
+                  "no underscores.",
+                  color=color_error,
+                  port=self.port)
+        return False
 
     def show_player_stats(self) -> None:
         """
@@ -199,14 +331,15 @@ class Game:
         player = self.player
 
         # Display player's basic stats
-        add_space()
+        add_space(port=self.port)
         attack = player.attack + player.weapon.attack if player.weapon \
             else player.attack
         defense = player.defense + player.armour.defense if player.armour \
             else player.defense
-        text(f"Player {player.name}:")
+        text(f"Player {player.name}:", port=self.port)
         text(
-            f"Health: {player.health}, Attack: {attack}, Defense: {defense}")
+            f"Health: {player.health}, Attack: {attack}, Defense: {defense}",
+            port=self.port)
 
         armour = player.armour.name if player.armour else "None"
         weapon = player.weapon.name if player.weapon else "None"
@@ -214,15 +347,15 @@ class Game:
                          + ' to Defense' if player.armour else ''
         weapon_attack = '- adds ' + str(player.weapon.attack) \
                         + ' to Attack' if player.weapon else ''
-        text(f"Armour: {armour} {armour_defense}")
-        text(f"Weapon: {weapon} {weapon_attack}")
+        text(f"Armour: {armour} {armour_defense}", port=self.port)
+        text(f"Weapon: {weapon} {weapon_attack}", port=self.port)
 
         # potions count
         potions_count = len(player.potions)
-        text(f"Potions: {potions_count}")
+        text(f"Potions: {potions_count}", port=self.port)
 
         items_count = len(player.inventory)
-        text(f"Inventory: {items_count}")
+        text(f"Inventory: {items_count}", port=self.port)
         self.location_and_position()
 
     def choose_action(self) -> None:
@@ -232,32 +365,16 @@ class Game:
         the player's choice.
         """
 
-        action = ask_user(prompt=">> ")
-        if action == "help":
-            show_help()
-        elif action == "map":
-            self.display_map()
-        elif action == "north":
-            self.move_north()
-        elif action == "south":
-            self.move_south()
-        elif action == "east":
-            self.move_east()
-        elif action == "west":
-            self.move_west()
-        elif action == "stats":
-            self.show_player_stats()
-        elif action in ["search", "s"]:
-            self.search_current_area()
-        elif action in ["inventory", "i"]:
-            self.show_inventory()
-        elif action in ["potion", "potions", "p"]:
-            self.select_potion()
-        elif action == "restart":
-            game_manager.reset_game()
-        else:
-            text("Invalid command. Use 'help' to view available commands.",
-                 color=color_error)
+        action = ask_user(prompt=">> ", port=self.port)
+        for command in commands.parse(action):
+            if command is None:
+                text("Invalid command. Use 'help' to view available "
+                     "commands.", color=color_error, port=self.port)
+                get_port(self.port).typeahead.clear()
+                break
+            command(self)
+            if self.game_over:
+                break
 
     def search_current_area(self):
         """
@@ -295,23 +412,35 @@ class Game:
         # Assign the player to the current location
         current_location.player = self.player
 
-    def location_and_position(self) -> None:
+    def location_header(self) -> str:
         """
-        This method displays the current location and the player's position.
+        Returns the name of the current location and of the area the
+        player is in.
         """
         current_location = self.get_current_location()
         area_name = current_location.get_area_name_by_position(
             current_location.player_position)
-        text(f"{current_location.name} - {area_name}", space=1)
+        return f"{current_location.name} - {area_name}"
+
+    def location_and_position(self) -> None:
+        """
+        This method displays the current location and the player's position.
+        """
+        text(self.location_header(), space=1, port=self.port)
 
     def display_map(self) -> None:
         """
-        This method displays the map of the current location.
+        This method displays the map of the current location. A map still
+        on the player's screen, under the same header, only has its changed
+        cells repainted.
         """
-        add_space()
-        self.location_and_position()
         current_location = self.get_current_location()
-        current_location.display_map()
+        header = self.location_header()
+        if current_location.repaint_map(header):
+            return
+        add_space(port=self.port)
+        text(header, space=1, port=self.port)
+        current_location.display_map(header)
 
     def update_player_position(self, dx: int, dy: int) -> None:
         """
@@ -333,9 +462,11 @@ class Game:
         # Check if the new position is valid
         if current_location.is_valid_position(new_position):
             current_location.player_position = new_position
+            self.steps += 1
             current_location.check_for_interaction(new_position, self.player)
         else:
-            text("You can't move in that direction.", color=color_error)
+            text("You can't move in that direction.", color=color_error,
+                 port=self.port)
 
     def move_north(self) -> None:
         """
@@ -366,29 +497,30 @@ class Game:
         Displays the player's inventory and prompts the player to interact with
         an item in the inventory."""
         if not self.player.inventory:
-            text("Your inventory is empty.")
+            text("Your inventory is empty.", port=self.port)
             return
 
-        add_space()
-        text("Your inventory contains:", space=1)
+        add_space(port=self.port)
+        text("Your inventory contains:", space=1, port=self.port)
         for index, item in enumerate(self.player.inventory, start=1):
             name = item.name
-            text(f"{index}. {name}")
-        add_space()
+            text(f"{index}. {name}", port=self.port)
+        add_space(port=self.port)
         prompt = "Select an item number to interact with, " \
                  "or type '0' to cancel: "
         choices = [str(i) for i in range(1, len(self.player.inventory) + 1)]
-        choice = ask_user("number", numbers=choices, prompt=prompt)
+        choice = ask_user("number", numbers=choices, prompt=prompt,
+                          port=self.port)
         try:
             choice_index = int(choice) - 1
             if 0 <= choice_index < len(self.player.inventory):
                 self.interact_with_inventory_item(choice_index)
             elif choice_index == -1:
-                text("Exiting inventory.")
+                text("Exiting inventory.", port=self.port)
             else:
-                text("Invalid choice.")
+                text("Invalid choice.", port=self.port)
         except ValueError:
-            text("Invalid input. Please enter a number.")
+            text("Invalid input. Please enter a number.", port=self.port)
 
     def interact_with_inventory_item(self, index):
         """
@@ -396,18 +528,18 @@ class Game:
         """
         item = self.player.inventory[index]
         name = item.name
-        add_space()
-        text(f"You selected {name}.", space=1)
+        add_space(port=self.port)
+        text(f"You selected {name}.", space=1, port=self.port)
 
-        action = ask_user("item")
+        action = ask_user("item", port=self.port)
         if action.lower() in ['use', 'u']:
             self.use_inventory_item(item)
         elif action.lower() in ['inspect', 'i']:
-            inspect_inventory_item(item)
+            inspect_inventory_item(item, port=self.port)
         elif action == '0':
-            text("Exiting inventory.")
+            text("Exiting inventory.", port=self.port)
         else:
-            text("Invalid action.")
+            text("Invalid action.", port=self.port)
 
     def use_inventory_item(self, item):
         """
@@ -416,26 +548,48 @@ class Game:
         name = item.name
 
         if isinstance(item, Book):
-            text(f"You have read the {name}.")
+            text(f"You have read the {name}.", port=self.port)
             self.interaction.print_story_line(item.story_line)
         elif isinstance(item, Spaceship):
             self.travel_to_new_location()
         elif isinstance(item, Special):
-            add_space()
+            add_space(port=self.port)
             self.interaction.print_story_line(item.story_line)
 
     def travel_to_new_location(self):
         """
         Travels to a new location.
         """
+        available_destinations = self.list_destinations()
+
+        # Get the user's choice
+        numbers = [str(i) for i in range(1, len(available_destinations) + 1)]
+        choice = ask_user("number",
+                          prompt="Where do you want to go? (type '0' to quit)",
+                          numbers=numbers, port=self.port)
+
+        new_location = self.fly_to(available_destinations, choice)
+        if new_location is None:
+            return
+
+        ask_user("continue", port=self.port)
+
+        # Check for interaction in the new location and mark it as visited
+        new_location.check_for_interaction((0, 0), self.player)
+        new_location.mark_visited((0, 0))
+
+    def list_destinations(self) -> list:
+        """
+        Lists the locations the player can travel to and returns their names.
+        """
         # Initial locations
         base_destinations = {'Yolkaris': ['Mystara'], 'Mystara': [
             'Yolkaris'], 'Luminara': ['Yolkaris', 'Mystara']}
         special_item_name = "Holographic Cosmos Codex"
 
         current_location = self.get_current_location()
-        add_space()
-        text("Select a location to travel to:", space=1)
+        add_space(port=self.port)
+        text("Select a location to travel to:", space=1, port=self.port)
 
         # Check if the player has the special item and adjust available
         # locations accordingly
@@ -451,24 +605,25 @@ class Game:
 
         # List available locations to travel to
         for index, location in enumerate(available_destinations, start=1):
-            text(f"{index}. {location}")
+            text(f"{index}. {location}", port=self.port)
 
-        add_space()
-
-        # Get the user's choice
-        numbers = [str(i) for i in range(1, len(available_destinations) + 1)]
-        choice = ask_user("number",
-                          prompt="Where do you want to go? (type '0' to quit)",
-                          numbers=numbers)
+        add_space(port=self.port)
+        return available_destinations
 
+    def fly_to(self, available_destinations, choice):
+        """
+        Flies the spaceship to the chosen destination and returns the new
+        location, or None if the player decided to stay.
+        """
         if choice == 0:
-            add_space(1)
+            add_space(1, port=self.port)
             paragraph("Charlie chose to stay grounded this time. With a swift "
                       "gesture, he watched the spaceship shrink into a small "
                       "egg, which he then carefully tucked into his pocket.",
-                      space=1)
-            return
+                      space=1, port=self.port)
+            return None
 
+        current_location = self.get_current_location()
         selected_location_name = available_destinations[int(choice) - 1]
 
         # Find the index of the selected location in the original
@@ -480,68 +635,88 @@ class Game:
         new_location.player_position = (0, 0)
         new_location.player_prev_position = (0, 0)
 
-        add_space()
+        add_space(port=self.port)
         current_location.print_travel_story_line('from')
         loading([f'{current_location.name} ', '* ', '* ', '* ', '* ',
-                 '* ', '* ', '* ', '* ', '* ', '* ', f'{new_location.name}'])
-        add_space()
-        add_space()
+                 '* ', '* ', '* ', '* ', '* ', '* ', f'{new_location.name}'],
+                port=self.port)
+        add_space(port=self.port)
+        add_space(port=self.port)
         new_location.print_travel_story_line('to')
-
-        ask_user("continue")
-
-        # Check for interaction in the new location and mark it as visited
-        new_location.check_for_interaction((0, 0), self.player)
-        new_location.mark_visited((0, 0))
+        return new_location
 
     def select_potion(self):
         """
         Selects a potion from the player's inventory to use.
         """
         if not self.player.potions:
-            text("You have no potions.")
+            text("You have no potions.", port=self.port)
             return
 
-        add_space()
-        text("Use Potions:", space=1)
-        add_space()
+        add_space(port=self.port)
+        text("Use Potions:", space=1, port=self.port)
+        add_space(port=self.port)
         for index, potion in enumerate(self.player.potions, start=1):
             name = potion.name
             health = potion.health
             display_text = f"{index}. {name} (Health: {health})"
-            text(display_text)
-        add_space()
+            text(display_text, port=self.port)
+        add_space(port=self.port)
         prompt = "Select a potion number to use it, or type '0' to cancel: "
         choices = [str(i) for i in range(1, len(self.player.potions) + 1)]
-        choice = ask_user("number", numbers=choices, prompt=prompt)
+        choice = ask_user("number", numbers=choices, prompt=prompt,
+                          port=self.port)
         try:
             choice_index = int(choice) - 1
             if 0 <= choice_index < len(self.player.potions):
                 potion = self.player.potions[choice_index]
                 self.use_potion(potion)
             elif choice_index == -1:
-                text("Exiting potions.")
+                text("Exiting potions.", port=self.port)
             else:
-                text("Invalid choice.")
+                text("Invalid choice.", port=self.port)
         except ValueError:
-            text("Invalid input. Please enter a number.")
+            text("Invalid input. Please enter a number.", port=self.port)
 
     def use_potion(self, potion):
         """
         Uses a potion from the player's inventory.
         """
         player = self.player
-        max_health = 100
+        max_health = PLAYER_HEALTH
         if player.health == max_health:
-            text("You are already at full health.")
+            text("You are already at full health.", port=self.port)
         else:
             player.health += potion.health
             if player.health > max_health:
                 player.health = max_health
             player.potions.remove(potion)
             text(f"You used a {potion.name}. Your health is "
-                 f"now {player.health}.")
+                 f"now {player.health}.", port=self.port)
 
 
 if __name__ == "__main__":
-    game_manager.start_game()
+    parser = argparse.ArgumentParser(description="Play Yolkaris Odyssey.")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="speed up the text delays, 0 removes them")
+    parser.add_argument("--seed", type=int,
+                        default=os.environ.get("YOLKARIS_SEED"),
+                        help="seed of the session, to replay it exactly")
+    parser.add_argument("--idle", type=float,
+                        default=os.environ.get("YOLKARIS_IDLE", 0),
+                        help="seconds without input before the game is "
+                             "saved and the session ends, 0 to never")
+    parser.add_argument("--journal", action="store_true",
+                        default=journal_enabled(),
+                        help="journal the answers, so the session can be "
+                             "rebuilt if the game is killed")
+    parser.add_argument("--db", default=os.environ.get("YOLKARIS_DB"),
+                        help="database recording the finished runs and "
+                             "saved sessions for the leaderboard")
+    args = parser.parse_args()
+    if args.db:
+        Store(args.db).install(game_manager)
+    terminal_port = TerminalPort(make_clock(args.speed))
+    terminal_port.idle_timeout = args.idle or None
+    game_manager.start_game(terminal_port, seed=args.seed,
+                            journal=args.journal)
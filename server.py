@@ -0,0 +1,403 @@
+import argparse
+import asyncio
+import inspect
+import random
+from collections import deque
+
+from utils import (text, add_space, ask_user_async, current_port,
+                   color_error, Port, ScreenBuffer, PlayerIdle, make_clock)
+from game.game_manager import GameManager
+from game.store import Store
+from game.journal import journal_enabled
+from game.odds import warm_odds
+from game.bundle import STORYLINES
+from game.commands import commands
+from game.items import Book, Spaceship, Special
+from game.async_engine import (AsyncInteraction, AsyncYolkaris, AsyncMystara,
+                               AsyncLuminara)
+from run import (Game, game_intro, show_game_levels,
+                 inspect_inventory_item)
+
+
+class AsyncSession(Port):
+    """
+    A player connected to the session host.
+
+    Delays never block: output written during a delay is held back and
+    sent when the clock calls back, so the game keeps running meanwhile.
+    Output between two delays or prompts is coalesced into a single write.
+    """
+
+    # Players connect with terminals that understand ANSI escape sequences.
+    cursor = True
+
+    def __init__(self, reader, writer, clock=None) -> None:
+        super().__init__(clock)
+        self.reader = reader
+        self.writer = writer
+        self.screen = ScreenBuffer()
+        self.held = deque()
+        self.waiting = None
+
+    def write(self, data) -> None:
+        """
+        Buffers data for the player, or holds it back until the current
+        delay is over.
+        """
+        self.count_output(data)
+        if self.waiting:
+            self.held.append(data)
+        else:
+            self.screen.write(data)
+
+    def flush(self) -> None:
+        """
+        Writes the buffered output to the connection.
+        """
+        data = self.screen.take()
+        if data:
+            self.writer.write(data.replace('\n', '\r\n').encode())
+
+    def pause(self, delay) -> None:
+        """
+        Starts a delay before the next piece of output, or queues it after
+        the current one.
+        """
+        if self.clock.scale(delay) <= 0:
+            return
+        if self.waiting:
+            self.held.append(float(delay))
+        else:
+            self.flush()
+            self.waiting = self.clock.schedule(delay, self.resume)
+
+    def resume(self) -> None:
+        """
+        Sends the output held back by a delay, up to the next delay.
+        """
+        self.waiting = None
+        while self.held:
+            data = self.held.popleft()
+            if isinstance(data, str):
+                self.screen.write(data)
+            else:
+                self.flush()
+                self.waiting = self.clock.schedule(data, self.resume)
+                return
+        self.flush()
+
+    async def read_line(self) -> str:
+        """
+        Waits for the next answer of the player, unless they already
+        typed it ahead.
+        """
+        if not self.waiting:
+            self.flush()
+        await self.writer.drain()
+        while not self.typeahead:
+            # Take everything the player sent so far, the answers typed
+            # ahead wait in the queue for the next prompts
+            try:
+                data = await asyncio.wait_for(self.reader.read(65536),
+                                              self.idle_timeout)
+            except asyncio.TimeoutError:
+                raise PlayerIdle() from None
+            if not data:
+                raise EOFError()
+            self.receive(data.decode('utf-8', errors='replace'))
+        return self.typeahead.pop()
+
+    async def close(self) -> None:
+        """
+        Drops any pending output and closes the connection.
+        """
+        if self.waiting:
+            self.waiting.cancel()
+        self.writer.close()
+
+
+class AsyncGame(Game):
+    """
+    Game whose prompts are awaited, so many games can share one process.
+    """
+
+    location_classes = {
+        "Yolkaris": AsyncYolkaris,
+        "Mystara": AsyncMystara,
+        "Luminara": AsyncLuminara
+    }
+
+    def __init__(self, port=None, seed=None) -> None:
+        super().__init__(port, seed)
+        self.interaction = AsyncInteraction(self, port=self.port,
+                                            rng=self.rng)
+
+    async def setup_game(self):
+        """
+        This method sets up the game.
+        """
+        game_intro(port=self.port)
+        await self.create_player()
+        if self.resumed:
+            self.welcome_back()
+            return
+        self.welcome_player()
+        show_game_levels(port=self.port)
+        game_level = await ask_user_async(prompt_type="game",
+                                          numbers=['1', '2'], port=self.port)
+        self.setup_areas(game_level)
+        self.generate_world()
+        starting_location = self.get_current_location()
+        await starting_location.check_for_interaction((0, 0), self.player)
+        self.display_map()
+
+    async def start_game(self) -> None:
+        """
+        This is the main game loop.
+        """
+        while not self.game_over:
+            self.save_checkpoint()
+            await self.choose_action()
+
+    async def create_player(self) -> None:
+        """
+        This creates the player.
+        """
+        while True:
+            username = await ask_user_async(
+                prompt_type=None, prompt="Please enter the username to start "
+                                         "your adventure: ", port=self.port)
+            if self.new_player(username):
+                break
+
+    async def choose_action(self) -> None:
+        """
+        Prompts the player to choose an action and runs it.
+        """
+        action = await ask_user_async(prompt=">> ", port=self.port)
+        for command in commands.parse(action):
+            if command is None:
+                text("Invalid command. Use 'help' to view available "
+                     "commands.", color=color_error, port=self.port)
+                self.port.typeahead.clear()
+                break
+            result = command(self)
+            if inspect.isawaitable(result):
+                await result
+            if self.game_over:
+                break
+
+    async def search_current_area(self):
+        """
+        Searches the current area for items.
+        """
+        await self.get_current_location().search_area(self.player)
+
+    async def update_player_position(self, dx: int, dy: int) -> None:
+        """
+        Updates the player's position in the current location.
+        """
+        current_location = self.get_current_location()
+        current_location.player_prev_position = \
+            current_location.player_position
+        new_position = (current_location.player_position[0] + dx,
+                        current_location.player_position[1] + dy)
+
+        if current_location.is_valid_position(new_position):
+            current_location.player_position = new_position
+            self.steps += 1
+            await current_location.check_for_interaction(new_position,
+                                                         self.player)
+        else:
+            text("You can't move in that direction.", color=color_error,
+                 port=self.port)
+
+    async def show_inventory(self):
+        """
+        Displays the player's inventory and prompts the player to interact with
+        an item in the inventory.
+        """
+        if not self.player.inventory:
+            text("Your inventory is empty.", port=self.port)
+            return
+
+        add_space(port=self.port)
+        text("Your inventory contains:", space=1, port=self.port)
+        for index, item in enumerate(self.player.inventory, start=1):
+            text(f"{index}. {item.name}", port=self.port)
+        add_space(port=self.port)
+        prompt = "Select an item number to interact with, " \
+                 "or type '0' to cancel: "
+        choices = [str(i) for i in range(1, len(self.player.inventory) + 1)]
+        choice = await ask_user_async("number", numbers=choices,
+                                      prompt=prompt, port=self.port)
+        if choice == 0:
+            text("Exiting inventory.", port=self.port)
+        else:
+            await self.interact_with_inventory_item(choice - 1)
+
+    async def interact_with_inventory_item(self, index):
+        """
+        Interacts with an item in the player's inventory.
+        """
+        item = self.player.inventory[index]
+        add_space(port=self.port)
+        text(f"You selected {item.name}.", space=1, port=self.port)
+
+        action = await ask_user_async("item", port=self.port)
+        if action in ['use', 'u']:
+            await self.use_inventory_item(item)
+        elif action in ['inspect', 'i']:
+            inspect_inventory_item(item, port=self.port)
+        else:
+            text("Exiting inventory.", port=self.port)
+
+    async def use_inventory_item(self, item):
+        """
+        Uses an item in the player's inventory.
+        """
+        if isinstance(item, Book):
+            text(f"You have read the {item.name}.", port=self.port)
+            await self.interaction.print_story_line(item.story_line)
+        elif isinstance(item, Spaceship):
+            await self.travel_to_new_location()
+        elif isinstance(item, Special):
+            add_space(port=self.port)
+            await self.interaction.print_story_line(item.story_line)
+
+    async def travel_to_new_location(self):
+        """
+        Travels to a new location.
+        """
+        available_destinations = self.list_destinations()
+        numbers = [str(i) for i in range(1, len(available_destinations) + 1)]
+        choice = await ask_user_async(
+            "number", prompt="Where do you want to go? (type '0' to quit)",
+            numbers=numbers, port=self.port)
+
+        new_location = self.fly_to(available_destinations, choice)
+        if new_location is None:
+            return
+
+        await ask_user_async("continue", port=self.port)
+        await new_location.check_for_interaction((0, 0), self.player)
+        new_location.mark_visited((0, 0))
+
+    async def select_potion(self):
+        """
+        Selects a potion from the player's inventory to use.
+        """
+        if not self.player.potions:
+            text("You have no potions.", port=self.port)
+            return
+
+        add_space(port=self.port)
+        text("Use Potions:", space=1, port=self.port)
+        add_space(port=self.port)
+        for index, potion in enumerate(self.player.potions, start=1):
+            text(f"{index}. {potion.name} (Health: {potion.health})",
+                 port=self.port)
+        add_space(port=self.port)
+        prompt = "Select a potion number to use it, or type '0' to cancel: "
+        choices = [str(i) for i in range(1, len(self.player.potions) + 1)]
+        choice = await ask_user_async("number", numbers=choices,
+                                      prompt=prompt, port=self.port)
+        if choice == 0:
+            text("Exiting potions.", port=self.port)
+        else:
+            self.use_potion(self.player.potions[choice - 1])
+
+
+async def play(reader, writer, speed: float = 1.0, columns: int = 80,
+               seed=None, idle=None, journal: bool = False,
+               store=None) -> None:
+    """
+    Plays games with one connected player until they disconnect.
+    Each connection runs in its own task, so the port set here is only
+    seen by this player's game. The session runs through a GameManager of
+    its own, like the sessions of the terminal: the first game is played
+    with the session's seed and the next ones with seeds drawn from it.
+    A player idle for longer than idle seconds has their game saved and
+    the connection closed, freeing the task until they resume it. With
+    journal, the answers are journaled so the session can be rebuilt if
+    the host dies. Finished runs and saved sessions are recorded in the
+    store, if one is given.
+    """
+    session = AsyncSession(reader, writer, make_clock(speed))
+    session.columns = columns
+    session.idle_timeout = idle
+    current_port.set(session)
+    seed = seed if seed is not None else random.getrandbits(32)
+    print(f"Session {writer.get_extra_info('peername')} seed {seed}")
+    manager = GameManager(game_class=AsyncGame)
+    if store:
+        store.install(manager, close=False)
+    try:
+        await manager.start_game_async(session, seed, journal)
+    except (EOFError, ConnectionError):
+        pass
+    finally:
+        await session.close()
+
+
+async def serve(host: str, port: int, speed: float = 1.0,
+                columns: int = 80, seed=None, idle=None,
+                journal: bool = False, database: str = None) -> None:
+    """
+    Accepts players on a TCP port and hosts all their games.
+    - seed: the seed the seeds of the sessions are drawn from, in the order
+      players connect (defaults to random seeds)
+    - idle: the seconds after which the games of idle players are saved
+      and their connections closed (defaults to never)
+    - journal: whether to journal the sessions, so they can be rebuilt
+    - database: the database recording the finished runs and saved
+      sessions (defaults to none)
+    """
+    sessions = random.Random(seed)
+    store = Store(database) if database else None
+    # Computed before any player connects, so fights never wait for them
+    for level in STORYLINES:
+        warm_odds(level)
+
+    def accept(reader, writer):
+        session_seed = sessions.getrandbits(32) if seed is not None \
+            else None
+        return play(reader, writer, speed, columns, session_seed, idle,
+                    journal, store)
+
+    server = await asyncio.start_server(accept, host, port)
+    print(f"Hosting Yolkaris Odyssey on {host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        # The writer is a daemon thread, rows still queued would be lost
+        if store:
+            store.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Host many Yolkaris Odyssey games in one process.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8023)
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="speed up the text delays, 0 removes them")
+    parser.add_argument("--columns", type=int, default=80,
+                        help="width of the players' screens")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed of the sessions, to replay them exactly")
+    parser.add_argument("--idle", type=float, default=0,
+                        help="seconds without input before a player's game "
+                             "is saved and their connection closed, 0 to "
+                             "never")
+    parser.add_argument("--journal", action="store_true",
+                        default=journal_enabled(),
+                        help="journal the answers, so sessions can be "
+                             "rebuilt if the server is killed")
+    parser.add_argument("--db", default=None,
+                        help="database recording the finished runs and "
+                             "saved sessions for the leaderboard")
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.speed, args.columns,
+                      args.seed, args.idle or None, args.journal, args.db))
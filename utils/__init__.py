@@ -1,7 +1,16 @@
 from .text_utils import (text, paragraph, add_space, clear_terminal, ask_user,
-                         loading, default_color, color_player, color_neutral,
-                         color_error)
+                         ask_user_async, loading, write, pause, get_port,
+                         current_port, default_color, color_player,
+                         color_neutral, color_error)
+from .ports import (Port, BufferedPort, TerminalPort, BufferPort, NullPort,
+                    SocketPort, ScreenBuffer, InputQueue, SEPARATOR,
+                    PlayerIdle)
+from .clock import Clock, InstantClock, make_clock
 
 __all__ = ['text', 'paragraph', 'add_space', 'clear_terminal', 'ask_user',
-           'loading', 'default_color', 'color_player', 'color_neutral',
-           'color_error']
+           'ask_user_async', 'loading', 'write', 'pause', 'get_port',
+           'current_port', 'default_color', 'color_player', 'color_neutral',
+           'color_error', 'Port', 'BufferedPort', 'TerminalPort',
+           'BufferPort', 'NullPort', 'SocketPort', 'ScreenBuffer',
+           'InputQueue', 'SEPARATOR', 'PlayerIdle', 'Clock', 'InstantClock',
+           'make_clock']
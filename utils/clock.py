@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+
+class Clock:
+    """
+    Times the delays between pieces of output.
+    - speed: how much faster than real time the delays run (1 is real time)
+    """
+
+    def __init__(self, speed: float = 1.0) -> None:
+        self.speed = speed
+        self.elapsed = 0.0
+
+    def scale(self, delay) -> float:
+        """
+        Returns how long the delay really lasts on this clock.
+        """
+        return delay / self.speed
+
+    def sleep(self, delay) -> None:
+        """
+        Blocks for the delay.
+        """
+        self.elapsed += delay
+        time.sleep(self.scale(delay))
+
+    async def sleep_async(self, delay) -> None:
+        """
+        Waits for the delay without blocking the event loop.
+        """
+        self.elapsed += delay
+        await asyncio.sleep(self.scale(delay))
+
+    def schedule(self, delay, callback):
+        """
+        Calls the callback once the delay has passed, without waiting for it.
+        Must be called from a running event loop. Returns the loop's handle.
+        """
+        self.elapsed += delay
+        return asyncio.get_running_loop().call_later(self.scale(delay),
+                                                     callback)
+
+
+class InstantClock(Clock):
+    """
+    Clock on which no delay takes any time. Still keeps count of the time
+    the delays would have taken.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(speed=float('inf'))
+
+    def scale(self, delay) -> float:
+        return 0.0
+
+    def sleep(self, delay) -> None:
+        self.elapsed += delay
+
+    async def sleep_async(self, delay) -> None:
+        self.elapsed += delay
+
+    def schedule(self, delay, callback):
+        self.elapsed += delay
+        return asyncio.get_running_loop().call_soon(callback)
+
+
+def make_clock(speed: float = 1.0) -> Clock:
+    """
+    Returns the clock for a speed multiplier, 0 meaning no delays at all.
+    """
+    if speed <= 0:
+        return InstantClock()
+    return Clock(speed)
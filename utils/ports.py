@@ -0,0 +1,407 @@
+import io
+import os
+import re
+import select
+import socket
+import sys
+import unicodedata
+from collections import deque
+from .clock import Clock, InstantClock
+
+# Moves the cursor home, clears the screen and its scrollback, like `clear`.
+CLEAR_SCREEN = "\033[H\033[2J\033[3J"
+RESET = "\033[0m"
+
+# Separates several answers typed on one line.
+SEPARATOR = ";"
+
+# Escape sequences, which take no room on the player's screen: CSI
+# sequences, OSC sequences and saving or restoring the cursor.
+ESCAPES = re.compile(r"\033(?:\[[0-9;?]*[A-Za-z]|\][^\007]*\007|[78])")
+
+
+def text_width(line: str) -> int:
+    """
+    Returns the columns a line without escape sequences takes on screen,
+    wide characters taking two.
+    """
+    if line.isascii():
+        return len(line)
+    return sum(2 if unicodedata.east_asian_width(char) in "WF" else 1
+               for char in line)
+
+
+class PlayerIdle(EOFError):
+    """
+    Raised when the player sent nothing for longer than the idle timeout of
+    their port.
+    """
+
+
+class ScreenBuffer:
+    """
+    Collects the output written between two prompts so it can be sent in a
+    single write.
+    - autoreset: reset the colours after every write, like colorama does
+    """
+
+    def __init__(self, autoreset: bool = True) -> None:
+        self.parts = []
+        self.autoreset = autoreset
+
+    def write(self, data) -> None:
+        """
+        Adds data to the buffer.
+        """
+        self.parts.append(data)
+        if self.autoreset:
+            self.parts.append(RESET)
+
+    def take(self) -> str:
+        """
+        Empties the buffer and returns its content.
+        """
+        data = ''.join(self.parts)
+        self.parts.clear()
+        return data
+
+
+class InputQueue:
+    """
+    Answers the player typed ahead of the prompts. Input is split into
+    answers at new lines and at ';', so 'n;n;e' answers three prompts.
+    """
+
+    def __init__(self) -> None:
+        self.answers = deque()
+        self.partial = ''
+        # Lines the player entered, each echoed on their screen
+        self.entered = 0
+
+    def __len__(self) -> int:
+        return len(self.answers)
+
+    def feed(self, data: str) -> list:
+        """
+        Adds input received from the player. A line is only queued once
+        its new line arrived. Returns the lines completed.
+        """
+        data = self.partial + data.replace('\r\n', '\n').replace('\r', '\n')
+        *lines, self.partial = data.split('\n')
+        self.entered += len(lines)
+        for line in lines:
+            if SEPARATOR in line:
+                self.answers.extend(answer.strip() for answer
+                                    in line.split(SEPARATOR)
+                                    if answer.strip())
+            else:
+                self.answers.append(line)
+        return lines
+
+    def peek(self) -> str:
+        """
+        Returns the next answer without taking it.
+        """
+        return self.answers[0]
+
+    def pop(self) -> str:
+        """
+        Takes the next answer.
+        """
+        return self.answers.popleft()
+
+    def clear(self) -> None:
+        """
+        Drops the answers typed ahead, after one of them was refused.
+        """
+        self.answers.clear()
+
+
+class Port:
+    """
+    Connects a game session to its player. Every piece of output, every
+    prompt and every delay of a game goes through its port.
+    - clock: the clock timing the delays (defaults to real time)
+    - columns: the width of the player's screen
+    """
+
+    # Seconds a prompt waits for the player before raising PlayerIdle,
+    # None to wait forever.
+    idle_timeout = None
+
+    # Journal the answers of the player are recorded in, if any.
+    journal = None
+
+    # Whether the player's terminal moves its cursor on escape sequences,
+    # and how many rows it shows.
+    cursor = False
+    rows = 24
+
+    def __init__(self, clock=None, columns: int = 80) -> None:
+        self.clock = clock if clock else Clock()
+        self.columns = columns
+        self.typeahead = InputQueue()
+        # Screens cleared and new lines written since, to know where
+        # earlier output is on the player's screen. Lines wider than the
+        # screen wrap onto more rows than they count for, so they are
+        # counted too, with the column the cursor is left at
+        self.page = 0
+        self.newlines = 0
+        self.overflows = 0
+        self.column = 0
+
+    def wrap_width(self) -> int:
+        """
+        Returns the width paragraphs are wrapped to, leaving a margin on the
+        right of the screen.
+        """
+        return max(self.columns - 6, 20)
+
+    def write(self, data) -> None:
+        """
+        Writes data to the player.
+        - data: the text to write, including any new lines
+        """
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """
+        Makes sure everything written so far reached the player.
+        """
+
+    def read_line(self) -> str:
+        """
+        Returns the next line entered by the player, without the new line.
+        Raises EOFError when the player is gone, PlayerIdle when they did
+        not answer within the idle timeout.
+        """
+        raise NotImplementedError
+
+    def typed_ahead(self) -> bool:
+        """
+        Checks whether the player already sent the answer of the next
+        prompt.
+        """
+        return bool(self.typeahead)
+
+    def pause(self, delay) -> None:
+        """
+        Waits between two pieces of output.
+        - delay: the delay in seconds
+        """
+        self.clock.sleep(delay)
+
+    def clear(self) -> None:
+        """
+        Clears the player's screen.
+        """
+        self.write(CLEAR_SCREEN)
+        self.page += 1
+        self.column = 0
+
+    def count_output(self, data: str) -> None:
+        """
+        Counts the new lines of output written, and its lines that may
+        have wrapped on the player's screen.
+        """
+        lines = ESCAPES.sub('', data).split('\n')
+        self.newlines += len(lines) - 1
+        column = self.column
+        for line in lines:
+            # A carriage return brings the cursor back to the first column
+            for index, piece in enumerate(line.split('\r')):
+                column = (column if index == 0 else 0) + text_width(piece)
+                if column > self.columns:
+                    self.overflows += 1
+            self.column = column
+            column = 0
+
+    def receive(self, data: str) -> None:
+        """
+        Queues input received from the player, counting the lines echoed on
+        their screen that may have wrapped.
+        """
+        for line in self.typeahead.feed(data):
+            if self.column + text_width(line) > self.columns:
+                self.overflows += 1
+            self.column = 0
+
+    def screen_line(self) -> tuple:
+        """
+        Returns the screen the cursor is on and its line, counted in new
+        lines written or entered since the screen was cleared, and the
+        lines that may have wrapped so far, which move it further down.
+        """
+        return (self.page, self.newlines + self.typeahead.entered,
+                self.overflows)
+
+
+class BufferedPort(Port):
+    """
+    Port that keeps its output in a screen buffer and sends it in one go
+    when the player is prompted or a delay starts.
+    """
+
+    def __init__(self, clock=None) -> None:
+        super().__init__(clock)
+        self.screen = ScreenBuffer()
+
+    # Terminals and socket clients understand ANSI escape sequences.
+    cursor = True
+
+    def write(self, data) -> None:
+        self.screen.write(data)
+        self.count_output(data)
+
+    def flush(self) -> None:
+        data = self.screen.take()
+        if data:
+            self.send(data)
+
+    def pause(self, delay) -> None:
+        if self.clock.scale(delay) > 0:
+            self.flush()
+        self.clock.sleep(delay)
+
+    def read_line(self) -> str:
+        self.flush()
+        while not self.typeahead:
+            self.receive(self.read_input())
+        return self.typeahead.pop()
+
+    def typed_ahead(self) -> bool:
+        if not self.typeahead:
+            data = self.poll_input()
+            if data:
+                self.receive(data)
+        return bool(self.typeahead)
+
+    def send(self, data) -> None:
+        """
+        Sends buffered output to the player.
+        """
+        raise NotImplementedError
+
+    def read_input(self) -> str:
+        """
+        Waits for input from the player, once the output is flushed, and
+        returns everything received so far. Raises EOFError when the player
+        is gone.
+        """
+        raise NotImplementedError
+
+    def poll_input(self) -> str:
+        """
+        Returns the input received from the player without waiting for it,
+        or an empty string if there is none.
+        """
+        return ''
+
+    def wait_input(self, source) -> None:
+        """
+        Waits until the player sent something, for at most the idle
+        timeout, and raises PlayerIdle if they did not.
+        - source: the file or socket the input arrives on
+        """
+        if self.idle_timeout is None:
+            return
+        ready, _, _ = select.select([source], [], [], self.idle_timeout)
+        if not ready:
+            raise PlayerIdle()
+
+
+class TerminalPort(BufferedPort):
+    """
+    Plays the game in the terminal the process runs in.
+    """
+
+    def send(self, data) -> None:
+        sys.stdout.write(data)
+        sys.stdout.flush()
+
+    def read_input(self) -> str:
+        # Read the terminal directly so that lines typed ahead are not
+        # hidden in the buffer of sys.stdin
+        try:
+            fd = sys.stdin.fileno()
+        except (AttributeError, ValueError, io.UnsupportedOperation):
+            return input() + '\n'
+        self.wait_input(fd)
+        data = os.read(fd, 65536)
+        if not data:
+            raise EOFError()
+        return data.decode('utf-8', errors='replace')
+
+    def poll_input(self) -> str:
+        try:
+            ready, _, _ = select.select([sys.stdin], [], [], 0)
+        except (AttributeError, ValueError, OSError, io.UnsupportedOperation):
+            return ''
+        return self.read_input() if ready else ''
+
+
+class BufferPort(Port):
+    """
+    Keeps the output in memory and answers prompts from a list of lines,
+    without any delays. Used by tests, bots and headless runs.
+    """
+
+    def __init__(self, lines=None, clock=None) -> None:
+        super().__init__(clock if clock else InstantClock())
+        self.lines = list(lines) if lines else []
+        self.output = io.StringIO()
+
+    def write(self, data) -> None:
+        self.output.write(data)
+
+    def read_line(self) -> str:
+        if not self.lines:
+            raise EOFError()
+        return self.lines.pop(0)
+
+    def getvalue(self) -> str:
+        """
+        Returns everything written so far.
+        """
+        return self.output.getvalue()
+
+
+class NullPort(BufferPort):
+    """
+    Discards the output and answers prompts from a list of lines.
+    """
+
+    def write(self, data) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class SocketPort(BufferedPort):
+    """
+    Plays the game over a connected socket, one game per connection.
+    """
+
+    def __init__(self, connection, clock=None) -> None:
+        super().__init__(clock)
+        self.connection = connection
+
+    def send(self, data) -> None:
+        self.connection.sendall(data.replace('\n', '\r\n').encode())
+
+    def read_input(self) -> str:
+        self.wait_input(self.connection)
+        data = self.connection.recv(65536)
+        if not data:
+            raise EOFError()
+        return data.decode('utf-8', errors='replace')
+
+    def poll_input(self) -> str:
+        try:
+            data = self.connection.recv(65536, socket.MSG_DONTWAIT)
+        except (BlockingIOError, InterruptedError):
+            return ''
+        if not data:
+            raise EOFError()
+        return data.decode('utf-8', errors='replace')
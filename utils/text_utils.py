@@ -1,7 +1,8 @@
 from colorama import Fore, Style, init
-import os
-import time
+from contextvars import ContextVar
+from functools import lru_cache
 import textwrap
+from .ports import TerminalPort
 
 # Initialize Colorama
 init(autoreset=True)
@@ -15,12 +16,83 @@ color_error = Style.NORMAL + Fore.RED
 
 color_ask_user = Fore.BLUE + Style.BRIGHT
 
+# Port used when the game is played in the terminal.
+terminal = TerminalPort()
+
+# Port of the game running in the current context. Hosts running many games
+# in one process set it per game; when it is not set the terminal is used.
+current_port = ContextVar("current_port", default=None)
+
+# Default prompt and error message for each prompt type of ask_user.
+prompts = {
+    "continue": ("Press enter to continue: ", None),
+    "number": ("Select a number: ",
+               "Invalid choice. Please select a correct number."),
+    "game": ("Select a game: ",
+             "Invalid choice. Please select a correct number."),
+    "confirm": ("Select 'yes' or 'no': ",
+                "Invalid input. Please enter 'yes' or 'no'."),
+    "item": ("Do you want to 'use' or 'inspect' the item? (u/i), type '0' "
+             "to cancel:",
+             "Invalid input. Please enter 'u' to use, 'i' to inspect the "
+             "item or '0' to cancel."),
+    "combat": ("Do you want to 'fight' or 'retreat'? ",
+               "Invalid input. Please enter 'fight' or 'retreat'."),
+    "retreat": ("To continue press enter or 'retreat': ",
+                "Invalid input. Please enter 'retreat' or enter."),
+}
+
+
+def get_port(port=None):
+    """
+    Returns the port to use: the one given, the one of the current context
+    or the terminal.
+    """
+    if port is not None:
+        return port
+    port = current_port.get()
+    return terminal if port is None else port
+
+
+def write(data, flush=False, port=None):
+    """
+    Writes raw data to the port.
+    - data: the text to write, including any new lines
+    - flush: whether to flush the output straight away
+    - port: the port to write to (defaults to the current one)
+    """
+    port = get_port(port)
+    port.write(data)
+    if flush:
+        port.flush()
+
+
+def pause(delay, port=None):
+    """
+    Waits between two pieces of output.
+    - delay: the delay in seconds
+    - port: the port of the game (defaults to the current one)
+    """
+    get_port(port).pause(delay)
+
+
+def color_line(text_line, color=default_color, space=0) -> str:
+    """
+    Returns a line of text colored and ready to print.
+    - text_line: the text of the line
+    - color: the color to apply to the text
+    - space: the number of new lines to add after the line
+    """
+    return (color + text_line if color else text_line) + \
+        Fore.RESET + '\n' * space + '\n'
+
 
 def text(
         text_line,
         delay=0.1,
         space=0,
-        color=default_color
+        color=default_color,
+        port=None
 ):
     """
     Prints text to the terminal with optional color.
@@ -28,60 +100,207 @@ def text(
     - delay: the delay between each character
     - space: the number of new lines to print after the text
     - color: the color to apply to the text
+    - port: the port to print to (defaults to the current one)
+    """
+    port = get_port(port)
+    port.write(color_line(text_line, color, space))
+    port.pause(delay)
+
+
+@lru_cache(maxsize=1024)
+def render_paragraph(long_string, width=74, color=default_color) -> tuple:
+    """
+    Returns the paragraph wrapped to the width and colored, one printable
+    line per entry, along with all of them joined. Story text is printed
+    again every time an area is revisited, so it is only rendered once per
+    width.
+    - long_string: the text to wrap
+    - width: the width to wrap the text to
+    - color: the color to apply to the text
     """
-    line_space = '\n' * space
-    colored_text = (color + text_line if color else text_line) + \
-        Fore.RESET + line_space
-    print(colored_text)
-    time.sleep(delay)
+    lines = textwrap.fill(long_string, width=width).split('\n')
+    lines[0] = ' ' * 3 + lines[0]
+    lines = tuple(color_line(line, color) for line in lines)
+    return lines, ''.join(lines)
 
 
 def paragraph(
         long_string,
         space=0,
         delay=0.1,
-        color=default_color
+        color=default_color,
+        port=None
 ):
     """
-    Prints a paragraph of text to the terminal with optional color.
+    Prints a paragraph of text to the terminal with optional color, wrapped
+    to the width of the port.
     - long_string: the text to wrap and print as a paragraph
     - space: the number of new lines to print after the paragraph
     - color: the color to apply to the text
+    - port: the port to print to (defaults to the current one)
     """
-    wrapped_text = textwrap.fill(long_string, width=74)
-    lines = wrapped_text.split('\n')
-
-    text(' ' * 3 + lines[0], color=color)
+    port = get_port(port)
+    lines, block = render_paragraph(long_string, port.wrap_width(), color)
 
-    for i in range(1, len(lines)):
-        line = lines[i]
-        if i == len(lines) - 1:
-            text(line, color=color)
-        else:
-            text(line, color=color)
+    if port.clock.scale(0.1) > 0:
+        for line in lines:
+            port.write(line)
+            port.pause(0.1)
+    else:
+        # Nothing to wait for between the lines: write them in one go
+        port.write(block)
+        port.pause(0.1 * len(lines))
 
-    add_space(space=space, delay=delay)
+    add_space(space=space, delay=delay, port=port)
 
 
-def add_space(space: int = 1, delay: float = 0.2):
+def add_space(space: int = 1, delay: float = 0.2, port=None):
     """
     This prints a new line to the terminal.
     - space: the number of new lines to print (default is 1)
     - delay: the delay between each new line
+    - port: the port to print to (defaults to the current one)
     """
+    port = get_port(port)
     if space > 1:
         line_space = '\n' * (space - 1)
-        print(line_space)
+        port.write(line_space + '\n')
     elif space == 1:
-        print('\n', end='')
-    time.sleep(delay)
+        port.write('\n')
+    port.pause(delay)
 
 
-def clear_terminal():
+def clear_terminal(port=None):
     """
     Clears terminal.
+    - port: the port to clear (defaults to the current one)
+    """
+    get_port(port).clear()
+
+
+def prompt_text(prompt_type: str = None, prompt: str = None) -> str:
+    """
+    Returns the text shown by ask_user for the prompt type.
+    - prompt_type: the type of prompt
+    - prompt: the prompt text passed by the caller (optional)
+    """
+    if prompt_type in ["combat", "retreat"]:
+        return prompts[prompt_type][0]
+    if prompt_type in prompts:
+        prompt = prompt if prompt else prompts[prompt_type][0]
+    else:
+        prompt = prompt if prompt else ""
+    if prompt_type == "confirm":
+        prompt += " (y/n): "
+    return prompt
+
+
+def parse_answer(prompt_type: str, answer: str, numbers: list):
+    """
+    Checks an answer given to ask_user.
+    Returns a (valid, value) tuple, value being what ask_user returns.
+    - prompt_type: the type of prompt
+    - answer: the line entered by the user
+    - numbers: the numbers accepted by 'number' and 'game' prompts
+    """
+    choice = answer.strip()
+    if prompt_type == "continue":
+        return True, None
+    elif prompt_type == "number":
+        if choice in numbers:
+            return True, int(choice)
+        elif choice == '0':
+            return True, 0
+    elif prompt_type == "game":
+        if choice in numbers:
+            return True, int(choice)
+    elif prompt_type == "confirm":
+        choice = choice.lower()
+        if choice in ['yes', 'y']:
+            return True, True
+        elif choice in ['no', 'n']:
+            return True, False
+    elif prompt_type == "item":
+        choice = choice.lower()
+        if choice in ['use', 'u', 'inspect', 'i', '0']:
+            return True, choice
+    elif prompt_type == "combat":
+        choice = choice.lower()
+        if choice == 'fight':
+            return True, True
+        elif choice == 'retreat':
+            return True, False
+    elif prompt_type == "retreat":
+        choice = choice.lower()
+        if choice == 'retreat':
+            return True, True
+        elif choice == '':
+            return True, False
+    else:
+        return True, choice.lower()
+    return False, None
+
+
+def error_text(prompt_type: str, error: str = None) -> str:
+    """
+    Returns the error shown by ask_user after an invalid answer.
+    """
+    return error if error else prompts[prompt_type][1]
+
+
+def skip_prompt(prompt_type: str, port) -> bool:
+    """
+    Checks whether a prompt can be fast-forwarded: 'continue' prompts are
+    skipped when the player already typed the answers of the prompts after
+    them. An empty answer typed ahead is kept for the prompt it was meant
+    for. Skips are journaled along with the answers, as whether a prompt
+    is skipped depends on when the answers arrived.
+    """
+    if prompt_type != "continue":
+        return False
+    journal = port.journal
+    if journal is not None and journal.replaying:
+        return journal.replay_skip()
+    skip = port.typed_ahead() and port.typeahead.peek() != ''
+    if skip and journal is not None:
+        journal.record_skip()
+    return skip
+
+
+def replayed_answer(port):
+    """
+    Returns the next answer of a session being rebuilt from its journal,
+    or None when the answer has to come from the player.
+    """
+    journal = port.journal
+    if journal is None or not journal.replaying:
+        return None
+    return journal.replay_answer()
+
+
+def read_answer(port) -> str:
+    """
+    Returns the next answer of the player, recorded in the journal of the
+    port if it has one.
+    """
+    answer = replayed_answer(port)
+    if answer is None:
+        answer = port.read_line()
+        if port.journal is not None:
+            port.journal.record(answer)
+    return answer
+
+
+async def read_answer_async(port) -> str:
     """
-    os.system('clear')
+    Same as read_answer, for ports whose read_line is a coroutine.
+    """
+    answer = replayed_answer(port)
+    if answer is None:
+        answer = await port.read_line()
+        if port.journal is not None:
+            port.journal.record(answer)
+    return answer
 
 
 def ask_user(
@@ -90,104 +309,81 @@ def ask_user(
         prompt: str = None,
         error: str = None,
         space: int = 0,
-        numbers=None
+        numbers=None,
+        port=None
 ):
     """
     Prompts the user for input with an optional color.
     - type: the type of prompt ('continue' or 'confirm')
     - color: the color to apply to the prompt text
     - prompt: the prompt text to display (optional)
+    - port: the port to ask through (defaults to the current one)
+    Answers the player typed ahead are used first, without waiting, and
+    dropped once one of them is refused.
     """
+    port = get_port(port)
     if numbers is None:
         numbers = ['1', '2']
-    if prompt_type == "continue":
-        prompt = prompt if prompt else "Press enter to continue: "
-        line_space = '\n' * (space - 1) if space > 0 else ''
-        print(color + prompt + Fore.RESET, end="")
-        input().strip().lower()
-        if space > 0:
-            print(line_space)
-    elif prompt_type == "number":
-        while True:
-            prompt = prompt if prompt else "Select a number: "
-            print(color + prompt + Fore.RESET, end="")
-            choice = input().strip()
-            if choice in numbers:
-                return int(choice)
-            elif choice == '0':
-                return 0
-            else:
-                error = error if error else ("Invalid choice. Please select a "
-                                             "correct number.")
-                text(color_error + error + Fore.RESET, space=1)
-    elif prompt_type == "game":
-        while True:
-            prompt = prompt if prompt else "Select a game: "
-            print(color + prompt + Fore.RESET, end="")
-            choice = input().strip()
-            if choice in numbers:
-                return int(choice)
-            error = error if error else ("Invalid choice. Please select a "
-                                         "correct number.")
-            text(color_error + error + Fore.RESET, space=1)
-    elif prompt_type == "confirm":
-        prompt = prompt if prompt else "Select 'yes' or 'no': "
-        while True:
-            print(color + prompt + " (y/n): " + Fore.RESET, end="")
-            choice = input().lower().strip()
-            if choice in ['yes', 'y']:
-                return True
-            elif choice in ['no', 'n']:
-                return False
-            error = error if error else ("Invalid input. Please enter 'yes' "
-                                         "or 'no'.")
-            text(color_error + error + Fore.RESET, space=1)
-    elif prompt_type == "item":
-        prompt = prompt if prompt else ("Do you want to 'use' or 'inspect' "
-                                        "the item? (u/i), type '0' to cancel:")
-        while True:
-            print(color + prompt + Fore.RESET, end="")
-            choice = input().lower().strip()
-            if choice in ['use', 'u', 'inspect', 'i', '0']:
-                return choice
-            error = error if error else ("Invalid input. Please enter 'u' to "
-                                         "use, 'i' to inspect the item or "
-                                         "'0' to cancel.")
-            text(color_error + error + Fore.RESET, space=1)
-    elif prompt_type == "combat":
-        prompt = "Do you want to 'fight' or 'retreat'? "
-        while True:
-            print(color + prompt + Fore.RESET, end="")
-            choice = input().lower().strip()
-            if choice == 'fight':
-                return True
-            elif choice == 'retreat':
-                return False
-            error = error if error else ("Invalid input. Please enter 'fight' "
-                                         "or 'retreat'.")
-            text(color_error + error + Fore.RESET, space=1)
-    elif prompt_type == "retreat":
-        prompt = "To continue press enter or 'retreat': "
-        while True:
-            print(color + prompt + Fore.RESET, end="")
-            choice = input().lower().strip()
-            if choice == 'retreat':
-                return True
-            elif choice == '':
-                return False
-            error = error if error else ("Invalid input. Please enter "
-                                         "'retreat' or enter.")
-            text(color_error + error + Fore.RESET, space=1)
-    else:
-        print(color + (prompt if prompt else "") + Fore.RESET, end="")
-        return input().strip().lower()
+    prompt = prompt_text(prompt_type, prompt)
+    value = None
+    while not skip_prompt(prompt_type, port):
+        port.write(color + prompt + Fore.RESET)
+        port.flush()
+        valid, value = parse_answer(prompt_type, read_answer(port), numbers)
+        if valid:
+            break
+        text(color_error + error_text(prompt_type, error) + Fore.RESET,
+             space=1, port=port)
+        # The answers typed after a refused one were meant for other
+        # prompts
+        port.typeahead.clear()
+    if prompt_type == "continue" and space > 0:
+        port.write('\n' * (space - 1) + '\n')
+    return value
+
+
+async def ask_user_async(
+        prompt_type: str = None,
+        color=color_ask_user,
+        prompt: str = None,
+        error: str = None,
+        space: int = 0,
+        numbers=None,
+        port=None
+):
+    """
+    Same as ask_user, but awaits the answer from a port whose read_line is
+    a coroutine instead of blocking.
+    """
+    port = get_port(port)
+    if numbers is None:
+        numbers = ['1', '2']
+    prompt = prompt_text(prompt_type, prompt)
+    value = None
+    while not skip_prompt(prompt_type, port):
+        port.write(color + prompt + Fore.RESET)
+        valid, value = parse_answer(prompt_type,
+                                    await read_answer_async(port), numbers)
+        if valid:
+            break
+        text(color_error + error_text(prompt_type, error) + Fore.RESET,
+             space=1, port=port)
+        # The answers typed after a refused one were meant for other
+        # prompts
+        port.typeahead.clear()
+    if prompt_type == "continue" and space > 0:
+        port.write('\n' * (space - 1) + '\n')
+    return value
 
 
-def loading(content=None, ending: str = None):
+def loading(content=None, ending: str = None, port=None):
+    port = get_port(port)
     if content is None:
         content = ["Loading", ".", ".", "."]
     for i in content:
-        print(default_color + i + Fore.RESET, end='', flush=True)
-        time.sleep(0.5)
-    print('\n' + default_color + ending + Fore.RESET) if ending else None
-    time.sleep(0.5) if ending else None
+        port.write(default_color + i + Fore.RESET)
+        port.flush()
+        port.pause(0.5)
+    if ending:
+        port.write('\n' + default_color + ending + Fore.RESET + '\n')
+        port.pause(0.5)
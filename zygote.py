@@ -0,0 +1,230 @@
+import fcntl
+import os
+import random
+import select
+import signal
+import socket
+import struct
+import sys
+import termios
+import threading
+
+import colorama
+
+# Importing run pulls in colorama and the game engine once, so every
+# forked session starts with it already in memory.
+from game.game_manager import game_manager
+from game.world import load_template
+from game.bundle import STORYLINES, load_banner
+from game.odds import warm_odds
+from game.store import Store
+from game.journal import journal_enabled
+from utils import TerminalPort
+import run  # noqa: F401
+
+# Load the world templates, their odds tables and the title banner before
+# forking, so every session shares them.
+for level in STORYLINES:
+    load_template(level)
+    warm_odds(level)
+load_banner()
+
+DEFAULT_SOCKET = "/tmp/yolkaris-zygote.sock"
+DEFAULT_POOL_SIZE = 4
+TERMINAL_COLS = 80
+TERMINAL_ROWS = 24
+# Seconds without input before a session's game is saved and its process
+# ends, 0 to never.
+IDLE_TIMEOUT = float(os.environ.get("YOLKARIS_IDLE", 0))
+# Whether sessions are journaled, so they can be rebuilt if killed.
+JOURNAL = journal_enabled()
+# Database the finished runs and saved sessions are recorded in, if any.
+DATABASE = os.environ.get("YOLKARIS_DB")
+
+
+def relay(source, target) -> None:
+    """
+    Copies bytes from one file descriptor to another until either side
+    closes, then ends the session process.
+    - source: the file descriptor to read from
+    - target: the file descriptor to write to
+    """
+    try:
+        while True:
+            data = os.read(source, 4096)
+            if not data:
+                break
+            while data:
+                written = os.write(target, data)
+                data = data[written:]
+    except OSError:
+        pass
+    os._exit(0)
+
+
+def attach_terminal(connection) -> threading.Thread:
+    """
+    Creates a pseudo terminal for the session, makes it the standard input
+    and output of the process and starts relaying it to the connection.
+    Returns the thread relaying the game output.
+    """
+    master, slave = os.openpty()
+    fcntl.ioctl(slave, termios.TIOCSWINSZ,
+                struct.pack("HHHH", TERMINAL_ROWS, TERMINAL_COLS, 0, 0))
+    for fd in (0, 1, 2):
+        os.dup2(slave, fd)
+    os.close(slave)
+
+    # The zygote decided buffering and colour support when it started,
+    # usually without a terminal attached, so decide again for the pty.
+    colorama.deinit()
+    sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout = open(1, "w", buffering=1, encoding="utf-8", closefd=False)
+    sys.stderr = open(2, "w", buffering=1, encoding="utf-8", closefd=False)
+    colorama.init(autoreset=True)
+
+    sock = connection.fileno()
+    threading.Thread(target=relay, args=(sock, master), daemon=True).start()
+    output = threading.Thread(target=relay, args=(master, sock), daemon=True)
+    output.start()
+    return output
+
+
+def run_session(listener, ready) -> None:
+    """
+    Runs inside a pre-forked child: waits for a connection, tells the zygote
+    it is busy and plays one game on it.
+    - listener: the listening socket shared with the zygote
+    - ready: the pipe used to notify the zygote that a session started
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    connection, _ = listener.accept()
+    os.write(ready, struct.pack("=i", os.getpid()))
+    listener.close()
+    os.close(ready)
+
+    os.setsid()
+    os.environ["TERM"] = "xterm-color"
+    # Every child inherits the zygote's random state, reseed so sessions
+    # do not share the same map layout and combat rolls.
+    random.seed()
+    output = attach_terminal(connection)
+
+    port = TerminalPort()
+    port.idle_timeout = IDLE_TIMEOUT or None
+    if DATABASE:
+        Store(DATABASE).install(game_manager)
+    try:
+        game_manager.start_game(port, journal=JOURNAL)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        sys.stdout.flush()
+        for fd in (0, 1, 2):
+            os.close(fd)
+        # Let the relay drain what is left in the pty before exiting.
+        output.join(timeout=5)
+        os._exit(0)
+
+
+class Zygote:
+    """
+    Pre-warmed fork server keeping a pool of idle children ready to serve a
+    game session over a UNIX socket.
+    """
+
+    def __init__(self, path: str = DEFAULT_SOCKET,
+                 pool_size: int = DEFAULT_POOL_SIZE) -> None:
+        self.path = path
+        self.pool_size = pool_size
+        self.idle = set()
+        self.listener = None
+        self.ready_read = None
+        self.ready_write = None
+
+    def spawn(self) -> None:
+        """
+        Forks a new idle child waiting for a connection.
+        """
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            os.close(self.ready_read)
+            try:
+                run_session(self.listener, self.ready_write)
+            finally:
+                os._exit(1)
+        self.idle.add(pid)
+
+    def fill_pool(self) -> None:
+        """
+        Forks children until the pool of idle children is full again.
+        """
+        while len(self.idle) < self.pool_size:
+            self.spawn()
+
+    def collect_busy(self) -> None:
+        """
+        Reads the pids of children that picked up a connection and removes
+        them from the idle pool.
+        """
+        data = os.read(self.ready_read, 4096)
+        for (pid,) in struct.iter_unpack("=i", data):
+            self.idle.discard(pid)
+
+    def reap(self) -> None:
+        """
+        Collects finished children so they do not linger as zombies.
+        """
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            self.idle.discard(pid)
+
+    def shutdown(self, *_) -> None:
+        """
+        Stops the idle children and removes the socket.
+        """
+        for pid in self.idle:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        sys.exit(0)
+
+    def serve(self) -> None:
+        """
+        Listens on the UNIX socket and keeps the pool topped up forever.
+        """
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.listener.bind(self.path)
+        self.listener.listen(128)
+        self.ready_read, self.ready_write = os.pipe()
+        signal.signal(signal.SIGTERM, self.shutdown)
+        signal.signal(signal.SIGINT, self.shutdown)
+
+        print(f"Zygote listening on {self.path} "
+              f"(pool: {self.pool_size})", file=sys.stderr)
+        self.fill_pool()
+        while True:
+            readable, _, _ = select.select([self.ready_read], [], [], 1.0)
+            if readable:
+                self.collect_busy()
+            self.reap()
+            self.fill_pool()
+
+
+if __name__ == "__main__":
+    socket_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SOCKET
+    pool = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_POOL_SIZE
+    Zygote(socket_path, pool).serve()